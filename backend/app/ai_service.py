@@ -7,11 +7,41 @@ Now includes Geospatial awareness and Brand Neutrality.
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+import openai
 import os
 
-# Initialize LLM (GPT-4o mini is cost-effective and fast)
-# It automatically looks for OPENAI_API_KEY in environment variables.
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+from .concurrency import TokenBucket, retry_async
+from .metrics import span
+
+def _build_llm():
+    """
+    LLM_PROVIDER=fake swaps in the deterministic offline model (tests, load tests).
+    """
+    if os.getenv("LLM_PROVIDER", "openai").lower() == "fake":
+        from .fake_llm import FakeProposalLLM
+        return FakeProposalLLM(delay_seconds=float(os.getenv("FAKE_LLM_DELAY_MS", "0")) / 1000)
+
+    # Initialize LLM (GPT-4o mini is cost-effective and fast)
+    # It automatically looks for OPENAI_API_KEY in environment variables.
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+
+llm = _build_llm()
+
+# Provider limits (shared by every bulk job in this process)
+LLM_RATE_LIMIT_PER_SEC = float(os.getenv("LLM_RATE_LIMIT_PER_SEC", "5"))
+LLM_RATE_LIMIT_BURST = float(os.getenv("LLM_RATE_LIMIT_BURST", "10"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))
+
+rate_limiter = TokenBucket(rate=LLM_RATE_LIMIT_PER_SEC, capacity=LLM_RATE_LIMIT_BURST)
+
+# Transient provider failures worth retrying (429s, timeouts, 5xx)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
 
 async def generate_proposal_text(
     kpis: dict,
@@ -60,14 +90,31 @@ async def generate_proposal_text(
     co2_formatted = f"{kpis['annual_co2_savings_tons']:,.1f}"
 
     # Run the chain asynchronously
-    result = await chain.ainvoke({
-        "num_engines": num_engines,
-        "solar_mw": solar_mw,
-        "battery_mwh": battery_mwh,
-        "latitude": latitude,
-        "capex": capex_formatted,
-        "co2": co2_formatted,
-        "lcoe": kpis.get("lcoe_cents_kwh")
-    })
-
-    return result
\ No newline at end of file
+    with span("llm.generate"):
+        result = await chain.ainvoke({
+            "num_engines": num_engines,
+            "solar_mw": solar_mw,
+            "battery_mwh": battery_mwh,
+            "latitude": latitude,
+            "capex": capex_formatted,
+            "co2": co2_formatted,
+            "lcoe": kpis.get("lcoe_cents_kwh")
+        })
+
+    return result
+
+async def generate_proposal_text_with_retry(**kwargs) -> str:
+    """
+    generate_proposal_text behind the shared rate limiter, with exponential-backoff retries.
+    Takes the same keyword arguments.
+    """
+    async def attempt():
+        await rate_limiter.acquire()
+        return await generate_proposal_text(**kwargs)
+
+    return await retry_async(
+        attempt,
+        retry_on=RETRYABLE_ERRORS,
+        max_retries=LLM_MAX_RETRIES,
+        base_delay=LLM_RETRY_BASE_DELAY
+    )
@@ -0,0 +1,184 @@
+"""
+Saved Configuration API Routes
+------------------------------
+CRUD and listing for user projects (the 'configurations' table).
+Simulation results are persisted on save so loading a project never re-runs the physics engine.
+"""
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import ValidationError
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.orm import Session, defer
+from .. import schemas, models, database
+from .simulation import simulate_cached
+
+router = APIRouter()
+
+MAX_PAGE_SIZE = 200
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+def _encode_cursor(created_at: datetime, config_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), config_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, config_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(config_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _build_row(item: schemas.ConfigurationCreate, db: Session) -> dict:
+    """
+    Validates the inputs, simulates them (a shared-cache hit right after /api/calculate)
+    and extracts the indexed KPI columns.
+    Results are always computed server-side so the KPI columns match 'input_params'.
+    """
+    try:
+        params = schemas.CalculationRequest.model_validate(item.input_params)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+    inputs = params.model_dump()
+    results = simulate_cached(db, inputs, stage="configurations")
+    kpis = results["kpis"]
+    return {
+        "name": item.name,
+        "input_params": inputs,
+        "results": results,
+        "latitude": params.latitude,
+        "lcoe_cents_kwh": kpis["lcoe_cents_kwh"],
+        "total_capex_usd": kpis["total_capex_usd"],
+    }
+
+def _get_or_404(db: Session, config_id: int) -> models.Configuration:
+    config = db.get(models.Configuration, config_id)
+    if config is None:
+        raise HTTPException(status_code=404, detail="Configuration not found")
+    return config
+
+# -----------------------------------------------------------------------------
+# Routes
+# -----------------------------------------------------------------------------
+@router.post("/configurations", response_model=schemas.Configuration, status_code=201)
+async def create_configuration(
+    request: schemas.ConfigurationCreate,
+    db: Session = Depends(database.get_db)
+):
+    """
+    Saves a project. The simulation results are stored with it.
+    """
+    row = _build_row(request, db)
+    config = models.Configuration(**row, created_at=datetime.now(timezone.utc))
+    db.add(config)
+    db.commit()
+    db.refresh(config)
+    return config
+
+@router.post("/configurations/bulk", response_model=list[schemas.ConfigurationSummary], status_code=201)
+def bulk_create_configurations(
+    request: schemas.ConfigurationBulkCreate,
+    db: Session = Depends(database.get_db)
+):
+    """
+    Saves many projects with a single batched INSERT ... RETURNING.
+    Plain 'def' so FastAPI runs it in the threadpool: up to 1000 simulations
+    would otherwise block the event loop for seconds.
+    """
+    # One timestamp per batch, like a single-statement insert would get from now().
+    created_at = datetime.now(timezone.utc)
+    rows = [{**_build_row(item, db), "created_at": created_at} for item in request.items]
+
+    stmt = insert(models.Configuration).returning(models.Configuration, sort_by_parameter_order=True)
+    configs = db.scalars(stmt, rows).all()
+    response = [schemas.ConfigurationSummary.model_validate(c) for c in configs]
+    db.commit()
+    return response
+
+@router.get("/configurations", response_model=schemas.ConfigurationPage)
+async def list_configurations(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    min_lcoe: Optional[float] = None,
+    max_lcoe: Optional[float] = None,
+    min_capex: Optional[float] = None,
+    max_capex: Optional[float] = None,
+    min_latitude: Optional[float] = None,
+    max_latitude: Optional[float] = None,
+    db: Session = Depends(database.get_db)
+):
+    """
+    Lists saved projects newest-first using keyset pagination on (created_at, id).
+    Each page is an index range scan, so cost does not grow with the page number.
+    """
+    Config = models.Configuration
+    query = db.query(Config).options(defer(Config.results))
+
+    # Range filters on the indexed KPI columns
+    bounds = [
+        (Config.lcoe_cents_kwh, min_lcoe, max_lcoe),
+        (Config.total_capex_usd, min_capex, max_capex),
+        (Config.latitude, min_latitude, max_latitude),
+    ]
+    for column, lower, upper in bounds:
+        if lower is not None:
+            query = query.filter(column >= lower)
+        if upper is not None:
+            query = query.filter(column <= upper)
+
+    if cursor:
+        created_at, config_id = _decode_cursor(cursor)
+        query = query.filter(or_(
+            Config.created_at < created_at,
+            and_(Config.created_at == created_at, Config.id < config_id)
+        ))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(Config.created_at.desc(), Config.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor}
+
+@router.get("/configurations/{config_id}", response_model=schemas.Configuration)
+async def get_configuration(config_id: int, db: Session = Depends(database.get_db)):
+    """
+    Loads a saved project including its stored simulation results (no recomputation).
+    """
+    return _get_or_404(db, config_id)
+
+@router.put("/configurations/{config_id}", response_model=schemas.Configuration)
+async def update_configuration(
+    config_id: int,
+    request: schemas.ConfigurationCreate,
+    db: Session = Depends(database.get_db)
+):
+    """
+    Replaces a saved project. Results are re-simulated from the new inputs.
+    """
+    # Simulate first: the spec lookup uses its own connection, so don't hold the session's meanwhile
+    row = _build_row(request, db)
+    config = _get_or_404(db, config_id)
+    for key, value in row.items():
+        setattr(config, key, value)
+    db.commit()
+    db.refresh(config)
+    return config
+
+@router.delete("/configurations/{config_id}", status_code=204)
+async def delete_configuration(config_id: int, db: Session = Depends(database.get_db)):
+    """
+    Deletes a saved project.
+    """
+    db.delete(_get_or_404(db, config_id))
+    db.commit()
+    return Response(status_code=204)
@@ -0,0 +1,217 @@
+"""
+Sweep Export API Routes
+-----------------------
+Runs a parameter sweep over the simulation engine and streams the KPIs as CSV or Parquet.
+Scenarios are generated and simulated one chunk at a time, so memory stays bounded by
+'chunk_size' (at most MAX_CHUNK_SIZE) no matter how many rows the sweep produces.
+"""
+import io
+import math
+import os
+import zlib
+from typing import Iterator, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy.orm import Session
+from .. import calculations, database
+from .simulation import get_engine_specs
+
+router = APIRouter()
+
+# Hard ceiling on rows per export (protects the container from runaway sweeps)
+EXPORT_MAX_ROWS = int(os.getenv("EXPORT_MAX_ROWS", "10000000"))
+
+PARQUET_CODECS = ("snappy", "zstd", "gzip", "none")
+
+# Upper bound on 'chunk_size', so a few concurrent exports can't exhaust the container's memory
+MAX_CHUNK_SIZE = 50_000
+
+# -----------------------------------------------------------------------------
+# Schemas
+# -----------------------------------------------------------------------------
+class SweepAxis(BaseModel):
+    """
+    One swept input: either explicit 'values' or an inclusive start/stop/step range.
+    """
+    values: Optional[List[float]] = None
+    start: Optional[float] = None
+    stop: Optional[float] = None
+    step: Optional[float] = Field(None, gt=0)
+
+    @model_validator(mode="after")
+    def check_form(self):
+        if self.values is None and None in (self.start, self.stop, self.step):
+            raise ValueError("Provide either 'values' or 'start', 'stop' and 'step'")
+        if self.values is not None and not self.values:
+            raise ValueError("'values' must not be empty")
+        return self
+
+    def size(self) -> int:
+        """
+        Number of points, computed without materializing the axis.
+        """
+        if self.values is not None:
+            return len(self.values)
+        steps = (self.stop - self.start) / self.step + 1e-9
+        if not math.isfinite(steps):
+            raise ValueError("Axis range is too large")
+        count = math.floor(steps) + 1
+        if count < 1:
+            raise ValueError("'stop' must be >= 'start'")
+        return count
+
+    def points(self) -> np.ndarray:
+        if self.values is not None:
+            return np.asarray(self.values, dtype=float)
+        return np.round(self.start + self.step * np.arange(self.size()), 10)
+
+class SweepExportRequest(BaseModel):
+    num_engines: SweepAxis
+    solar_mw: SweepAxis
+    battery_mwh: SweepAxis
+    latitude: SweepAxis = SweepAxis(values=[0.0])
+    format: Literal["csv", "parquet"] = "csv"
+    # Scenarios simulated per chunk. The batch engine holds several (N, 24) float64 arrays,
+    # so peak memory is roughly 1.1-1.4 KB per scenario (~60 MB at the cap, ~690 MB at 500k).
+    chunk_size: int = Field(10_000, ge=1, le=MAX_CHUNK_SIZE)
+    # CSV: 'gzip' or none. Parquet: snappy (default), zstd, gzip or none.
+    compression: Optional[str] = None
+
+# -----------------------------------------------------------------------------
+# Chunk generation
+# -----------------------------------------------------------------------------
+def _iter_chunks(axes: List[np.ndarray], engine_specs: dict, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Walks the cartesian product of the axes by flat index, so no full grid is ever built.
+    """
+    shape = tuple(len(axis) for axis in axes)
+    total = int(np.prod(shape))
+
+    for offset in range(0, total, chunk_size):
+        flat = np.arange(offset, min(offset + chunk_size, total))
+        num_engines, solar_mw, battery_mwh, latitude = (
+            axis[idx] for axis, idx in zip(axes, np.unravel_index(flat, shape))
+        )
+        kpis = calculations.calculate_kpis_batch(num_engines, solar_mw, battery_mwh, engine_specs, latitude)
+        yield pd.DataFrame({
+            "num_engines": num_engines.astype(int),
+            "solar_mw": solar_mw,
+            "battery_mwh": battery_mwh,
+            "latitude": latitude,
+            **kpis
+        })
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file object that hands back whatever was written since the last drain.
+    Lets ParquetWriter emit row groups straight into the HTTP stream.
+    """
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+def _stream_csv(chunks: Iterator[pd.DataFrame], gzip: bool) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31) if gzip else None  # wbits=31 -> gzip container
+    header = True
+    for df in chunks:
+        data = df.to_csv(index=False, header=header).encode()
+        header = False
+        if compressor:
+            data = compressor.compress(data)
+        if data:
+            yield data
+    if compressor:
+        yield compressor.flush()
+
+def _stream_parquet(chunks: Iterator[pd.DataFrame], codec: str) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _ChunkSink()
+    writer = None
+    try:
+        for df in chunks:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema, compression=codec)
+            # Each chunk becomes one row group, flushed to the client immediately
+            writer.write_table(table)
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        if writer is not None:
+            writer.close()
+    yield sink.drain()
+
+# -----------------------------------------------------------------------------
+# Routes
+# -----------------------------------------------------------------------------
+@router.post("/export/sweep")
+async def export_sweep(
+    request: SweepExportRequest,
+    db: Session = Depends(database.get_db)
+):
+    """
+    Streams one KPI row per scenario in the sweep (cartesian product of the axes).
+    """
+    sweep = [request.num_engines, request.solar_mw, request.battery_mwh, request.latitude]
+    try:
+        # Sized arithmetically (exact Python ints) so oversized sweeps are rejected before any allocation
+        total_rows = math.prod(axis.size() for axis in sweep)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if total_rows > EXPORT_MAX_ROWS:
+        raise HTTPException(status_code=400, detail=f"Sweep has {total_rows} rows (limit {EXPORT_MAX_ROWS})")
+
+    axes = [axis.points() for axis in sweep]
+    if not np.all(axes[0] == np.round(axes[0])):
+        raise HTTPException(status_code=400, detail="'num_engines' values must be whole numbers")
+
+    # Specs are fetched before streaming starts; the DB session is closed by then.
+    chunks = _iter_chunks(axes, get_engine_specs(db), request.chunk_size)
+    headers = {"X-Total-Rows": str(total_rows)}
+
+    if request.format == "csv":
+        if request.compression not in (None, "none", "gzip"):
+            raise HTTPException(status_code=400, detail="CSV compression must be 'gzip' or omitted")
+        gzip = request.compression == "gzip"
+        filename = "sweep.csv.gz" if gzip else "sweep.csv"
+        media_type = "application/gzip" if gzip else "text/csv"
+        body = _stream_csv(chunks, gzip)
+    else:
+        codec = request.compression or "snappy"
+        if codec not in PARQUET_CODECS:
+            raise HTTPException(status_code=400, detail=f"Parquet compression must be one of {PARQUET_CODECS}")
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires 'pyarrow'")
+        filename = "sweep.parquet"
+        media_type = "application/vnd.apache.parquet"
+        body = _stream_parquet(chunks, codec)
+
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    # Sync generator: Starlette iterates it in a worker thread, keeping the event loop free.
+    return StreamingResponse(body, media_type=media_type, headers=headers)
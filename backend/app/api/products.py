@@ -0,0 +1,127 @@
+"""
+Product Catalogue API Routes
+----------------------------
+Paginated, HTTP-cacheable catalogue listing and bulk catalogue import.
+"""
+import csv
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from .. import schemas, models, database, catalogue
+from ..metrics import record_cache, span
+
+router = APIRouter()
+
+MAX_PAGE_SIZE = 1000
+
+# Browsers and proxies may reuse a page briefly, then must revalidate with the ETag.
+CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+def _validators(db: Session, category: Optional[str], cursor: Optional[int], limit: int):
+    """
+    Builds (ETag, Last-Modified) from one aggregate query over the filtered catalogue,
+    so a 304 can be answered without loading any product rows.
+    """
+    query = db.query(
+        func.count(models.Product.id),
+        func.max(models.Product.id),
+        func.max(models.Product.updated_at),
+    )
+    if category:
+        query = query.filter(models.Product.category == category)
+    count, max_id, last_modified = query.one()
+
+    if last_modified is not None and last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+    fingerprint = f"{category}|{cursor}|{limit}|{count}|{max_id}|{last_modified}"
+    etag = '"' + hashlib.sha1(fingerprint.encode()).hexdigest()[:20] + '"'
+    return etag, last_modified
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    RFC 9110: If-None-Match takes precedence over If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+@router.get("/products", response_model=schemas.ProductPage)
+async def get_products(
+    request: Request,
+    response: Response,
+    category: Optional[str] = None,
+    cursor: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(database.get_db)
+):
+    """
+    Fetch available hardware specs (Engines, Solar, etc.)
+    Filters on the indexed 'category' column and pages by id (keyset).
+    Sends ETag / Last-Modified and answers conditional requests with 304.
+    """
+    with span("products.validators"):
+        etag, last_modified = _validators(db, category, cursor, limit)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    not_modified = _not_modified(request, etag, last_modified)
+    record_cache("products_http", hit=not_modified)
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    query = db.query(models.Product)
+    if category:
+        query = query.filter(models.Product.category == category)
+    if cursor is not None:
+        query = query.filter(models.Product.id > cursor)
+
+    # Fetch one extra row to know whether another page exists
+    products = query.order_by(models.Product.id).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(products) > limit:
+        products = products[:limit]
+        next_cursor = products[-1].id
+
+    response.headers.update(headers)
+    return {"items": products, "next_cursor": next_cursor}
+
+@router.post("/products/import", response_model=schemas.ProductImportResult)
+def import_products(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|jsonl)$"),
+    db: Session = Depends(database.get_db)
+):
+    """
+    Bulk-imports a CSV or JSONL catalogue (format defaults to the file extension).
+    The upload is read line by line and written in batches; existing names are updated.
+    Plain 'def' so the file read and batched writes run in the threadpool, off the event loop.
+    """
+    file_format = format or (file.filename or "").rsplit(".", 1)[-1].lower()
+    if file_format not in catalogue.READERS:
+        raise HTTPException(status_code=400, detail="Unsupported catalogue format (use csv or jsonl)")
+
+    lines = (raw.decode("utf-8-sig") for raw in file.file)
+    try:
+        return catalogue.import_products(db, catalogue.READERS[file_format](lines))
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=str(e))
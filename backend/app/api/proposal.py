@@ -4,61 +4,67 @@ Proposal API Routes
 Endpoint to generate AI-written summaries.
 Now supports Geospatial inputs (Latitude) for site-specific context.
 """
+import asyncio
+import json
+from typing import List, Optional
+
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
-from .. import ai_service, calculations, models, database
+from .. import ai_service, calculations, database
+from ..cache import cache, cached_engine_specs, catalogue_version, make_key
+from ..result_store import result_store
+from ..metrics import span
+from .simulation import simulate_cached
 
 router = APIRouter()
 
+# Neutral default used when the catalogue has no engine
+DEFAULT_ENGINE_SPECS = {
+    "nominal_power_mw": 10.0,
+    "capex_per_kw": 800
+}
+
 # Update Schema to include Latitude
 class ProposalRequest(BaseModel):
     num_engines: int
     solar_mw: float
     battery_mwh: float
     latitude: float = 0.0  # Default to Equator if not provided
+    result_id: Optional[str] = None  # Handle from /api/calculate to skip the re-run
 
 class ProposalResponse(BaseModel):
     proposal_text: str
 
+class BulkProposalRequest(BaseModel):
+    items: List[ProposalRequest] = Field(..., min_length=1, max_length=1000)
+    max_concurrency: int = Field(8, ge=1, le=64)  # Simultaneous LLM calls for this job
+
 @router.post("/generate-proposal", response_model=ProposalResponse)
 async def generate_proposal(
     request: ProposalRequest,
     db: Session = Depends(database.get_db)
 ):
     """
-    1. Calculates performance metrics with Geospatial physics (Internal Re-run).
+    1. Reuses the KPIs from /api/calculate via 'result_id', then the shared simulation cache
+       (re-runs the simulation only on a miss).
     2. Sends metrics + Latitude context to LLM.
     3. Returns text summary.
     """
+    inputs = request.model_dump(exclude={"result_id"})
+    kpis = result_store.get_kpis(request.result_id, inputs) if request.result_id else None
+
     try:
-        # Step 1: Get Engine Specs (Generic search to be safe)
-        engine_product = db.query(models.Product).filter(models.Product.category == "engine").first()
-        
-        # Fallback if DB is empty (Neutral default)
-        if not engine_product:
-             engine_specs = {
-                "nominal_power_mw": 10.0,
-                "capex_per_kw": 800
-            }
-        else:
-            engine_specs = engine_product.specs
-
-        # Step 2: Run the Math (We need the KPIs to feed the AI)
-        # Now passing 'latitude' to the simulation engine
-        sim_result = calculations.calculate_hybrid_performance(
-            num_engines=request.num_engines,
-            solar_mw=request.solar_mw,
-            battery_mwh=request.battery_mwh,
-            engine_specs=engine_specs,
-            latitude=request.latitude # <--- Geospatial Input
-        )
-        
-        kpis = sim_result["kpis"]
+        if kpis is None:
+            # Steps 1 + 2: Get Engine Specs and run the Math (We need the KPIs to feed the AI)
+            # The cache helpers release the pooled connection, so none is held while waiting on the LLM
+            kpis = simulate_cached(db, inputs, fallback_specs=DEFAULT_ENGINE_SPECS, stage="proposal")["kpis"]
 
         # Step 3: Generate AI Text
         # Now passing 'latitude' to the AI Service
-        text = await ai_service.generate_proposal_text(
+        # Same provider budget (shared rate limiter + retries) as the bulk endpoint
+        text = await ai_service.generate_proposal_text_with_retry(
             kpis=kpis,
             num_engines=request.num_engines,
             solar_mw=request.solar_mw,
@@ -70,5 +76,85 @@ async def generate_proposal(
 
     except Exception as e:
         print(f"AI Generation Error: {e}")
-        # Graceful fallback if OpenAI fails
-        return {"proposal_text": f"Error generating AI proposal: {str(e)}. However, simulation shows {sim_result['kpis']['annual_co2_savings_tons']} tons of CO2 savings."}
\ No newline at end of file
+        # Graceful fallback if OpenAI fails (the simulation itself may have failed too)
+        if kpis is None:
+            return {"proposal_text": f"Error generating AI proposal: {str(e)}."}
+        return {"proposal_text": f"Error generating AI proposal: {str(e)}. However, simulation shows {kpis['annual_co2_savings_tons']} tons of CO2 savings."}
+
+@router.post("/generate-proposal/bulk")
+async def generate_proposals_bulk(
+    request: BulkProposalRequest,
+    db: Session = Depends(database.get_db)
+):
+    """
+    Generates proposals for many configurations at once.
+    1. Reuses stored KPIs for items with a valid 'result_id' or a cached simulation; looks up
+       engine specs once and runs the remaining simulations as one vectorized batch.
+    2. Fans out LLM calls behind a per-job semaphore, the shared rate limiter and retries.
+    3. Streams NDJSON lines in completion order, tagged with the request 'index'.
+    """
+    items = request.items
+    all_kpis = [
+        result_store.get_kpis(item.result_id, item.model_dump(exclude={"result_id"})) if item.result_id else None
+        for item in items
+    ]
+    missing = [i for i, kpis in enumerate(all_kpis) if kpis is None]
+
+    if missing:
+        version = catalogue_version(db)
+        for i in missing:
+            cached = cache.get(make_key("simulation", version, items[i].model_dump(exclude={"result_id"})))
+            if cached is not None:
+                all_kpis[i] = cached["kpis"]
+        missing = [i for i in missing if all_kpis[i] is None]
+
+    if missing:
+        engine_specs = cached_engine_specs(db) or DEFAULT_ENGINE_SPECS
+
+        with span("proposal_bulk.simulation"):
+            batch = calculations.calculate_kpis_batch(
+                num_engines=[items[i].num_engines for i in missing],
+                solar_mw=[items[i].solar_mw for i in missing],
+                battery_mwh=[items[i].battery_mwh for i in missing],
+                engine_specs=engine_specs,
+                latitude=[items[i].latitude for i in missing]
+            )
+        for row, i in enumerate(missing):
+            all_kpis[i] = {key: float(values[row]) for key, values in batch.items()}
+
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+
+    async def generate_one(index: int, item: ProposalRequest, kpis: dict) -> dict:
+        async with semaphore:
+            try:
+                text = await ai_service.generate_proposal_text_with_retry(
+                    kpis=kpis,
+                    num_engines=item.num_engines,
+                    solar_mw=item.solar_mw,
+                    battery_mwh=item.battery_mwh,
+                    latitude=item.latitude
+                )
+                return {"index": index, "status": "ok", "proposal_text": text, "kpis": kpis}
+            except Exception as e:
+                print(f"AI Generation Error (bulk item {index}): {e}")
+                return {
+                    "index": index,
+                    "status": "error",
+                    "proposal_text": f"Error generating AI proposal: {str(e)}. However, simulation shows {kpis['annual_co2_savings_tons']} tons of CO2 savings.",
+                    "kpis": kpis
+                }
+
+    async def stream():
+        tasks = [
+            asyncio.create_task(generate_one(i, item, kpis))
+            for i, (item, kpis) in enumerate(zip(items, all_kpis))
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield json.dumps(await next_done) + "\n"
+        finally:
+            # Client went away (or we finished): stop any outstanding LLM calls
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -3,12 +3,58 @@ Simulation API Routes
 ---------------------
 Endpoints for triggering the calculation engine.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from .. import schemas, calculations, models, database
+from .. import schemas, calculations, database
+from ..cache import cache, cached_engine_specs, catalogue_version, make_key
+from ..result_store import result_store
+from ..metrics import span
 
 router = APIRouter()
 
+def get_engine_specs(db: Session) -> dict:
+    """
+    Returns the specs of the default engine product.
+    In a real app, the user would select the engine type ID.
+    Here we default to the first engine found.
+    Served from the shared cache (keyed by catalogue version) after the first lookup.
+    """
+    specs = cached_engine_specs(db)
+
+    if specs is None:
+        # Fallback if DB is empty (shouldn't happen with init_db)
+        raise HTTPException(status_code=500, detail="No engine data available")
+
+    return specs
+
+def simulate_cached(db: Session, inputs: dict, fallback_specs: Optional[dict] = None, stage: str = "calculate") -> dict:
+    """
+    Runs calculate_hybrid_performance through the shared cache.
+    'inputs' holds num_engines, solar_mw, battery_mwh and latitude; 'fallback_specs' is used
+    (uncached) when the catalogue has no engine. The key includes the
+    catalogue version, so results computed by any worker are reused by all of them until
+    the products table changes. The returned dict is shared: copy it before modifying.
+    """
+    with span(f"{stage}.cache_lookup"):
+        key = make_key("simulation", catalogue_version(db), inputs)
+        result = cache.get(key)
+    if result is not None:
+        return result
+
+    with span(f"{stage}.spec_lookup"):
+        specs = cached_engine_specs(db)
+    if specs is None and fallback_specs is None:
+        raise HTTPException(status_code=500, detail="No engine data available")
+
+    with span(f"{stage}.simulation"):
+        result = calculations.calculate_hybrid_performance(engine_specs=specs or fallback_specs, **inputs)
+    # Runs on fallback specs are not cached: they don't reflect the catalogue
+    if specs is not None:
+        cache.set(key, result)
+    return result
+
 @router.post("/calculate", response_model=schemas.CalculationResponse)
 async def run_simulation(
     request: schemas.CalculationRequest,
@@ -17,32 +63,23 @@ async def run_simulation(
     """
     Receives configuration inputs (Engines, Solar, Battery).
     Fetches Engine specs from DB.
-    Runs Pandas simulation.
-    Returns Charts & KPIs.
+    Runs Pandas simulation (or reuses a cached run with the same inputs).
+    Returns Charts & KPIs, plus a 'result_id' the proposal endpoint can reuse.
     """
-    # 1. Fetch Engine Specs (Wärtsilä 31SG)
-    # In a real app, the user would select the engine type ID. 
-    # Here we default to the first engine found.
-    engine_product = db.query(models.Product).filter(models.Product.category == "engine").first()
-    
-    if not engine_product:
-        # Fallback if DB is empty (shouldn't happen with init_db)
-        raise HTTPException(status_code=500, detail="No engine data available")
+    inputs = request.model_dump()
+    try:
+        # 1 + 2. Fetch Engine Specs (Wärtsilä 31SG) and run the calculation
+        result = simulate_cached(db, inputs)
+        result = {**result, "result_id": result_store.put(inputs, result["kpis"])}
 
-    # 2. Extract specs
-    specs = engine_product.specs
+        # 3. Validate + serialize once with pydantic-core and return the bytes directly
+        # (skips FastAPI's second validation / jsonable_encoder pass, and makes this stage measurable)
+        with span("calculate.serialize"):
+            body = schemas.CalculationResponse.model_validate(result).model_dump_json()
+        return Response(content=body, media_type="application/json")
 
-    # 3. Run Calculation
-    try:
-        result = calculations.calculate_hybrid_performance(
-        num_engines=request.num_engines,
-        solar_mw=request.solar_mw,
-        battery_mwh=request.battery_mwh,
-        engine_specs=specs,
-        latitude=request.latitude
-    )
-        return result
-        
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Simulation Error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
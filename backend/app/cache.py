@@ -0,0 +1,234 @@
+"""
+Cache Backends
+--------------
+Two-tier cache shared by the simulation and proposal paths:
+- L1: in-process LRU (per worker, no serialization cost)
+- L2: SQLite file on local disk, read and written by every uvicorn worker on the host
+
+Entries derived from the product catalogue are keyed by a catalogue version (a fingerprint
+of the 'products' table), so any product change invalidates them on every worker.
+
+Configuration:
+    CACHE_BACKEND=memory|sqlite   (default memory; use sqlite with several workers)
+    CACHE_PATH                    (SQLite file, default /tmp/hyperion-cache.sqlite3)
+    CACHE_L1_MAX_ENTRIES          (default 2048)
+    CACHE_TTL_SECONDS             (default 900)
+    CACHE_VERSION_TTL_SECONDS     (how long a worker trusts its catalogue version, default 5)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from .metrics import record_cache
+from .models import Product
+
+class CacheBackend:
+    """
+    Minimal key/value interface. Values must be JSON-serializable and treated as read-only.
+    """
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe LRU with per-entry TTL. Lookups are reported to /metrics under 'name' (if set).
+    """
+    def __init__(self, max_entries: int = 2048, default_ttl: float = 900.0, name: Optional[str] = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.name = name
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if self.name:
+            record_cache(self.name, hit=entry is not None)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SQLiteCache(CacheBackend):
+    """
+    Host-wide cache in a SQLite file (WAL mode, so readers never block the writer).
+    Uses wall-clock expiry because monotonic clocks are not comparable across processes.
+    """
+    PURGE_EVERY = 500  # Writes between sweeps of expired rows
+
+    def __init__(self, path: str, default_ttl: float = 900.0, name: Optional[str] = None):
+        self.path = path
+        self.default_ttl = default_ttl
+        self.name = name
+        self._local = threading.local()
+        self._writes = 0
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections are per-thread; each worker thread keeps its own
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._connect().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        if self.name:
+            record_cache(self.name, hit=row is not None)
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.time() + (ttl if ttl is not None else self.default_ttl)
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at)
+        )
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    def delete(self, key: str):
+        self._connect().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connect().execute("DELETE FROM cache")
+
+class TieredCache(CacheBackend):
+    """
+    Reads L1 then L2 (promoting L2 hits into L1); writes go to both.
+    """
+    def __init__(self, l1: MemoryCache, l2: CacheBackend):
+        self.l1 = l1
+        self.l2 = l2
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.l1.get(key)
+        if value is None:
+            value = self.l2.get(key)
+            if value is not None:
+                self.l1.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.l1.set(key, value, ttl)
+        self.l2.set(key, value, ttl)
+
+    def delete(self, key: str):
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def clear(self):
+        self.l1.clear()
+        self.l2.clear()
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+
+def build_cache() -> CacheBackend:
+    ttl = float(os.getenv("CACHE_TTL_SECONDS", "900"))
+    l1 = MemoryCache(max_entries=int(os.getenv("CACHE_L1_MAX_ENTRIES", "2048")), default_ttl=ttl, name="cache_l1")
+    if CACHE_BACKEND == "sqlite":
+        l2 = SQLiteCache(os.getenv("CACHE_PATH", "/tmp/hyperion-cache.sqlite3"), default_ttl=ttl, name="cache_l2")
+        return TieredCache(l1, l2)
+    return l1
+
+cache = build_cache()
+
+# -----------------------------------------------------------------------------
+# Catalogue-versioned helpers
+# -----------------------------------------------------------------------------
+CACHE_VERSION_TTL_SECONDS = float(os.getenv("CACHE_VERSION_TTL_SECONDS", "5"))
+
+_version_memo = {"value": None, "expires_at": 0.0}
+
+def catalogue_version(db: Session) -> str:
+    """
+    Fingerprint of the 'products' table (row count, max id, latest updated_at).
+    Every worker derives the same value from the same table state, so they share L2 keys.
+    Recomputed at most once per CACHE_VERSION_TTL_SECONDS per worker.
+    Reads on its own short-lived connection, so the caller's session (and any pending changes)
+    is left untouched and no pooled connection is held across the caller's later awaits.
+    """
+    now = time.monotonic()
+    if _version_memo["value"] is not None and _version_memo["expires_at"] > now:
+        return _version_memo["value"]
+
+    with db.get_bind().connect() as conn:
+        count, max_id, last_modified = conn.execute(
+            select(func.count(Product.id), func.max(Product.id), func.max(Product.updated_at))
+        ).one()
+
+    version = hashlib.sha1(f"{count}|{max_id}|{last_modified}".encode()).hexdigest()[:12]
+    _version_memo.update(value=version, expires_at=now + CACHE_VERSION_TTL_SECONDS)
+    return version
+
+def invalidate_catalogue_version():
+    """
+    Forces the next catalogue_version() call to re-read the products table.
+    """
+    _version_memo.update(value=None, expires_at=0.0)
+
+def make_key(namespace: str, version: str, payload: Any = None) -> str:
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:20]
+    return f"{namespace}:{version}:{digest}"
+
+def cached_engine_specs(db: Session) -> Optional[dict]:
+    """
+    Specs of the default engine product, or None if the catalogue has no engine.
+    Like catalogue_version(), reads outside the caller's session.
+    """
+    key = make_key("engine_specs", catalogue_version(db))
+    entry = cache.get(key)
+    if entry is None:
+        with db.get_bind().connect() as conn:
+            specs = conn.execute(
+                select(Product.specs).where(Product.category == "engine").order_by(Product.id).limit(1)
+            ).scalar()
+        entry = {"specs": specs}
+        cache.set(key, entry)
+    return entry["specs"]
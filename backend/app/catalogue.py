@@ -0,0 +1,163 @@
+"""
+Product Catalogue Import
+------------------------
+Streams CSV / JSONL hardware catalogues into the 'products' table.
+Rows are upserted by name in fixed-size batches, so memory stays flat for large files.
+
+CLI usage:
+    python -m app.catalogue products.csv [--batch-size 500]
+"""
+import csv
+import json
+import math
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterable, Iterator
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from .cache import invalidate_catalogue_version
+from .models import Product
+
+DEFAULT_BATCH_SIZE = 500
+
+# -----------------------------------------------------------------------------
+# Readers
+# -----------------------------------------------------------------------------
+def _coerce(value: str):
+    """
+    Converts CSV cell text into int/float where possible.
+    'nan' / 'inf' stay text: non-finite floats are not valid JSON for the specs column.
+    """
+    for cast in (int, float):
+        try:
+            number = cast(value)
+        except ValueError:
+            continue
+        return number if math.isfinite(number) else value
+    return value
+
+def _reject_constant(name: str):
+    raise ValueError(f"{name} is not a valid spec value")
+
+def _loads(text: str):
+    """
+    json.loads without the NaN / Infinity extensions.
+    """
+    return json.loads(text, parse_constant=_reject_constant)
+
+def read_csv(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Reads a CSV with 'name' and 'category' columns.
+    Specs come from a JSON 'specs' column if present, otherwise every other column becomes a spec.
+    """
+    for row in csv.DictReader(lines):
+        name = row.pop("name", None)
+        category = row.pop("category", None)
+        if "specs" in row:
+            specs = _loads(row["specs"] or "{}")
+        else:
+            specs = {key: _coerce(value) for key, value in row.items() if key and value not in (None, "")}
+        yield {"name": name, "category": category, "specs": specs}
+
+def read_jsonl(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Reads one JSON object per line: {"name": ..., "category": ..., "specs": {...}}.
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield _loads(line)
+
+READERS = {
+    "csv": read_csv,
+    "jsonl": read_jsonl,
+}
+
+# -----------------------------------------------------------------------------
+# Import
+# -----------------------------------------------------------------------------
+def _validate(row: dict, line: int) -> dict:
+    if not isinstance(row, dict):
+        raise ValueError(f"Row {line}: expected a JSON object")
+    if not row.get("name") or not row.get("category"):
+        raise ValueError(f"Row {line}: 'name' and 'category' are required")
+    specs = row.get("specs") or {}
+    if not isinstance(specs, dict):
+        raise ValueError(f"Row {line}: 'specs' must be an object")
+    return {"name": str(row["name"]), "category": str(row["category"]), "specs": specs}
+
+def import_products(db: Session, rows: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Upserts products by name using one batched INSERT and one batched UPDATE per chunk.
+    Commits once at the end so a malformed file leaves the catalogue untouched,
+    then invalidates this worker's catalogue version.
+    Raises ValueError for malformed rows.
+    """
+    inserted = updated = 0
+    numbered = enumerate(rows, start=1)
+
+    try:
+        while True:
+            chunk = list(islice(numbered, batch_size))
+            if not chunk:
+                break
+
+            # Last occurrence wins if a name repeats within a chunk
+            batch = {}
+            for line, row in chunk:
+                product = _validate(row, line)
+                batch[product["name"]] = product
+
+            existing = dict(db.execute(
+                select(Product.name, Product.id).where(Product.name.in_(batch.keys()))
+            ).all())
+
+            now = datetime.now(timezone.utc)
+            new_rows = [{**p, "updated_at": now} for name, p in batch.items() if name not in existing]
+            changed_rows = [{**p, "id": existing[name], "updated_at": now} for name, p in batch.items() if name in existing]
+
+            if new_rows:
+                db.execute(insert(Product), new_rows)
+            if changed_rows:
+                db.execute(update(Product), changed_rows)
+
+            inserted += len(new_rows)
+            updated += len(changed_rows)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # Cached specs/simulations are keyed by catalogue version; other workers notice
+    # the new version within CACHE_VERSION_TTL_SECONDS
+    invalidate_catalogue_version()
+
+    return {"inserted": inserted, "updated": updated}
+
+# -----------------------------------------------------------------------------
+# CLI
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+    from .database import SessionLocal, engine, Base
+
+    parser = argparse.ArgumentParser(description="Import a product catalogue (CSV or JSONL).")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=sorted(READERS), help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    file_format = args.format or args.path.rsplit(".", 1)[-1].lower()
+    if file_format not in READERS:
+        parser.error(f"Unsupported format '{file_format}'")
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        with open(args.path, encoding="utf-8-sig", newline="") as f:
+            summary = import_products(db, READERS[file_format](f), batch_size=args.batch_size)
+        print(f"✅ Imported catalogue: {summary['inserted']} inserted, {summary['updated']} updated.")
+    finally:
+        db.close()
@@ -0,0 +1,63 @@
+"""
+Async Concurrency Helpers
+-------------------------
+Token-bucket rate limiting and exponential-backoff retries for outbound provider calls.
+"""
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+class TokenBucket:
+    """
+    Allows 'rate' acquisitions per second on average, with bursts up to 'capacity'.
+    A rate <= 0 disables limiting.
+
+    No lock is needed: refill-and-take runs without an await in between,
+    so it is atomic on the event loop.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+async def retry_async(
+    call: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    max_retries: int = 4,
+    base_delay: float = 0.5,
+    max_delay: float = 20.0,
+) -> T:
+    """
+    Awaits call(), retrying on 'retry_on' errors with exponential backoff and jitter.
+    The last error is re-raised once retries are exhausted.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except retry_on:
+            if attempt >= max_retries:
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            # "Equal jitter" keeps retries from synchronising across workers
+            await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
+            attempt += 1
@@ -0,0 +1,56 @@
+"""
+Local Fake LLM
+--------------
+Deterministic stand-in for the OpenAI chat model, for offline tests, benchmarks and load tests.
+Enable it with LLM_PROVIDER=fake (FAKE_LLM_DELAY_MS simulates provider latency).
+"""
+import asyncio
+import hashlib
+import time
+from typing import Any, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+class FakeProposalLLM(BaseChatModel):
+    """
+    Returns the same text for the same prompt, after a fixed delay.
+    """
+    delay_seconds: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "hyperion-fake"
+
+    def _reply(self, messages: List[BaseMessage]) -> ChatResult:
+        prompt = "\n".join(str(m.content) for m in messages)
+        digest = hashlib.sha1(prompt.encode()).hexdigest()[:8]
+        text = (
+            f"[Offline draft {digest}] This hybrid plant pairs fast-start Industrial Gas Engines "
+            "with Solar PV and Battery storage, keeping supply reliable through solar intermittency "
+            "while lowering fuel use and CO2 emissions."
+        )
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        return self._reply(messages)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.delay_seconds:
+            await asyncio.sleep(self.delay_seconds)
+        return self._reply(messages)
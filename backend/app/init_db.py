@@ -3,16 +3,44 @@ Database Initialization Script
 ------------------------------
 Creates tables and seeds initial data (Wärtsilä Engines).
 """
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 from .database import engine, Base
 from .models import Product
+from .catalogue import import_products
+
+def add_missing_columns():
+    """
+    Idempotent in-place upgrade for databases created before a column was added to models.py.
+    create_all() only creates missing tables, so e.g. 'products.updated_at' has to be added here
+    on existing volumes. Columns are added as nullable and existing rows are backfilled.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                print(f"🔧 Adding column {table.name}.{column.name}")
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                if column.server_default is not None:
+                    # SQLite can't ADD COLUMN with a non-constant default, so backfill instead
+                    default = column.server_default.arg.compile(dialect=engine.dialect)
+                    conn.execute(text(f"UPDATE {table.name} SET {column.name} = {default}"))
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
 
 def init_db(db: Session):
     """
-    Creates tables and populates seed data if DB is empty.
+    Creates tables, upgrades older schemas and populates seed data if DB is empty.
     """
-    # 1. Create all tables defined in models.py
+    # 1. Create all tables defined in models.py (and add columns missing from older databases)
     Base.metadata.create_all(bind=engine)
+    add_missing_columns()
 
     # 2. Check if products exist
     if db.query(Product).first():
@@ -22,38 +50,38 @@ def init_db(db: Session):
 
     # Seed Data: Wärtsilä 31SG (Gas Engine)
     # Specs based on public data: ~12MW output, High efficiency
-    engine_w31sg = Product(
-        name="Wärtsilä 31SG",
-        category="engine",
-        specs={
+    engine_w31sg = {
+        "name": "Wärtsilä 31SG",
+        "category": "engine",
+        "specs": {
             "nominal_power_mw": 12.0,
             "electrical_efficiency": 0.51, # 51% Efficiency
             "heat_rate_kj_kwh": 7058,      # Approx heat rate
             "capex_per_kw": 800,           # Estimated $800/kW
             "opex_per_mwh": 5.0            # Variable Opex
         }
-    )
+    }
 
     # Seed Data: Utility Scale Solar PV
-    solar_pv = Product(
-        name="Utility Solar PV",
-        category="solar",
-        specs={
+    solar_pv = {
+        "name": "Utility Solar PV",
+        "category": "solar",
+        "specs": {
             "capex_per_kw": 700,
             "opex_per_kw_year": 12
         }
-    )
+    }
 
     # Seed Data: Li-Ion Battery Storage
-    battery = Product(
-        name="GridScale Li-Ion BESS",
-        category="battery",
-        specs={
+    battery = {
+        "name": "GridScale Li-Ion BESS",
+        "category": "battery",
+        "specs": {
             "capex_per_kwh": 350,
             "round_trip_efficiency": 0.93
         }
-    )
+    }
 
-    db.add_all([engine_w31sg, solar_pv, battery])
-    db.commit()
-    print("✅ Database seeding complete.")
\ No newline at end of file
+    # Same batched path as catalogue imports (single INSERT for the seed set)
+    import_products(db, [engine_w31sg, solar_pv, battery])
+    print("✅ Database seeding complete.")
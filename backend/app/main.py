@@ -6,16 +6,16 @@ Includes detailed health checks for system modules.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
 import pandas as pd
 import sqlalchemy
 
-from .database import get_db, SessionLocal
+from .database import SessionLocal
 from .init_db import init_db
-from . import models
-from .api import simulation, proposal
+from . import metrics
+from .api import simulation, proposal, configurations, products, export
 
 # -----------------------------------------------------------------------------
 # Lifespan Event Handler
@@ -58,6 +58,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency histograms + opt-in profiling (ENABLE_PROFILING=1, header 'X-Profile')
+app.add_middleware(metrics.TimingMiddleware)
+
 # -----------------------------------------------------------------------------
 # Routes
 # -----------------------------------------------------------------------------
@@ -66,6 +69,12 @@ app.add_middleware(
 app.include_router(simulation.router, prefix="/api", tags=["Simulation"])
 # Register the AI Proposal Router
 app.include_router(proposal.router, prefix="/api", tags=["AI Proposal"])
+# Register the Saved Configurations Router
+app.include_router(configurations.router, prefix="/api", tags=["Configurations"])
+# Register the Product Catalogue Router
+app.include_router(products.router, tags=["Products"])
+# Register the Sweep Export Router
+app.include_router(export.router, prefix="/api", tags=["Export"])
 
 @app.get("/")
 async def root():
@@ -85,10 +94,9 @@ async def health_check():
         }
     }
 
-@app.get("/products")
-async def get_products(db: Session = Depends(get_db)):
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def prometheus_metrics():
     """
-    Fetch available hardware specs (Engines, Solar, etc.)
+    Prometheus scrape endpoint: request/stage latency histograms and cache hit rates.
     """
-    products = db.query(models.Product).all()
-    return products
\ No newline at end of file
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
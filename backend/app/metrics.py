@@ -0,0 +1,227 @@
+"""
+Latency Instrumentation
+-----------------------
+Minimal Prometheus-format metrics (no client library needed), per-stage timing spans,
+an ASGI timing middleware and an opt-in per-request profiler.
+
+Profiling is enabled with ENABLE_PROFILING=1 and triggered per request with the header
+'X-Profile: cprofile' (or 'pyinstrument' if installed). The response body is replaced
+by the profile report. When disabled, the only cost is one header lookup.
+"""
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+# Latency buckets in seconds (sub-millisecond engine stages up to multi-second LLM calls)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(str(labels[name]) for name in self.labelnames), 0.0)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += seconds
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = 'le="%s"' % bound
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {series[-1]}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}"
+
+# -----------------------------------------------------------------------------
+# Metric definitions
+# -----------------------------------------------------------------------------
+http_request_duration = Histogram(
+    "hyperion_http_request_duration_seconds", "End-to-end HTTP request latency.", ("method", "route", "status")
+)
+stage_duration = Histogram(
+    "hyperion_stage_duration_seconds", "Latency of individual request stages (DB, simulation, serialization, LLM).", ("stage",)
+)
+stage_errors = Counter(
+    "hyperion_stage_errors_total", "Stages that raised an exception.", ("stage",)
+)
+cache_requests = Counter(
+    "hyperion_cache_requests_total", "Cache lookups by outcome.", ("cache", "result")
+)
+
+METRICS = (http_request_duration, stage_duration, stage_errors, cache_requests)
+
+def render() -> str:
+    """
+    Prometheus text exposition format (version 0.0.4).
+    Also derives a hit-ratio gauge per cache from the lookup counters.
+    """
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+
+    caches = sorted({key[0] for key in cache_requests._values})
+    if caches:
+        lines.append("# HELP hyperion_cache_hit_ratio Hits / lookups since process start.")
+        lines.append("# TYPE hyperion_cache_hit_ratio gauge")
+        for cache in caches:
+            hits = cache_requests.value(cache=cache, result="hit")
+            total = hits + cache_requests.value(cache=cache, result="miss")
+            lines.append(f'hyperion_cache_hit_ratio{{cache="{cache}"}} {hits / total if total else 0.0}')
+
+    return "\n".join(lines) + "\n"
+
+@contextmanager
+def span(stage: str):
+    """
+    Times a block into hyperion_stage_duration_seconds{stage=...}.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        stage_errors.inc(stage=stage)
+        raise
+    finally:
+        stage_duration.observe(time.perf_counter() - start, stage=stage)
+
+def record_cache(cache: str, hit: bool):
+    cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+# -----------------------------------------------------------------------------
+# ASGI middleware
+# -----------------------------------------------------------------------------
+PROFILING_ENABLED = os.getenv("ENABLE_PROFILING", "0").lower() in ("1", "true", "yes")
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware (cheaper than BaseHTTPMiddleware and safe for streaming responses).
+    Labels requests by route template, so path parameters don't explode cardinality.
+    """
+    def __init__(self, app, profiling_enabled: bool = PROFILING_ENABLED):
+        self.app = app
+        self.profiling_enabled = profiling_enabled
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.profiling_enabled:
+            mode = dict(scope["headers"]).get(b"x-profile")
+            if mode:
+                await self._profile(mode.decode().lower(), scope, receive, send)
+                return
+
+        status = 500
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status
+            )
+
+    async def _profile(self, mode: str, scope, receive, send):
+        """
+        Runs the request under a profiler and returns the report instead of the normal body.
+        cProfile only sees code on the event-loop thread (not threadpool work).
+        """
+        status = 500
+        async def capture(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        if mode == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                await _send_text(send, 501, "pyinstrument is not installed")
+                return
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+            try:
+                await self.app(scope, receive, capture)
+            finally:
+                profiler.stop()
+            report = profiler.output_text(unicode=True)
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, capture)
+            finally:
+                profiler.disable()
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(40)
+            report = buffer.getvalue()
+
+        await _send_text(send, 200, report, [(b"x-profiled-status", str(status).encode())])
+
+async def _send_text(send, status: int, text: str, headers=()):
+    body = text.encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode()), *headers],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -3,7 +3,7 @@ SQLAlchemy Data Models
 ----------------------
 Defines the schema for the 'products' and 'configurations' tables.
 """
-from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -23,6 +23,9 @@ class Product(Base):
     # Battery: {"capacity_mwh": 1, "efficiency": 0.95}
     specs = Column(JSON) 
 
+    # Drives the ETag / Last-Modified validators on GET /products
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
 class Configuration(Base):
     """
     Stores a saved project configuration created by a user.
@@ -39,5 +42,16 @@ class Configuration(Base):
     # Calculated results persisted for quick retrieval
     # e.g., {"co2_reduction": 40.5, "total_capex": 15000000}
     results = Column(JSON)
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+
+    # Headline values extracted from the JSON blobs on write so that listing
+    # filters hit a B-tree index instead of scanning JSON on every row.
+    latitude = Column(Float, index=True)
+    lcoe_cents_kwh = Column(Float, index=True)
+    total_capex_usd = Column(Float, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Keyset pagination walks (created_at, id) newest-first.
+    __table_args__ = (
+        Index("ix_configurations_created_at_id", "created_at", "id"),
+    )
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Simulation Result Store
+-----------------------
+Bounded, TTL-evicted in-memory store of recent simulation KPIs.
+/api/calculate hands out a 'result_id'; the proposal endpoint uses it to skip re-running the simulation.
+Handles are per worker and never touch the shared cache: on a miss (e.g. the proposal lands on
+another worker) the proposal falls back to the shared simulation cache, keyed by inputs.
+"""
+import os
+import threading
+import uuid
+from typing import Optional
+
+from .cache import MemoryCache
+from .metrics import record_cache
+
+class ResultStore:
+    """
+    LRU map of handle -> (inputs, kpis) with a per-entry time-to-live.
+    Thread-safe: sync routes and the event loop may touch it concurrently.
+    """
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 900.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = MemoryCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, inputs: dict, kpis: dict) -> str:
+        """
+        Stores the KPIs for a simulation run and returns its handle.
+        Only KPIs are kept (not the hourly charts) so each entry stays small.
+        """
+        handle = uuid.uuid4().hex
+        self._entries.set(handle, (dict(inputs), dict(kpis)))
+        return handle
+
+    def get_kpis(self, handle: str, inputs: dict) -> Optional[dict]:
+        """
+        Returns the stored KPIs, or None if the handle is unknown, expired,
+        or was produced from different inputs.
+        """
+        entry = self._entries.get(handle)
+        hit = entry is not None and entry[0] == inputs
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        record_cache("result_store", hit=hit)
+        return dict(entry[1]) if hit else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+result_store = ResultStore(
+    max_entries=int(os.getenv("RESULT_STORE_MAX_ENTRIES", "1024")),
+    ttl_seconds=float(os.getenv("RESULT_STORE_TTL_SECONDS", "900"))
+)
@@ -4,8 +4,8 @@ Pydantic Schemas
 Data validation and serialization for API requests/responses.
 Updated for Pydantic V2 syntax (ConfigDict).
 """
-from pydantic import BaseModel, ConfigDict
-from typing import Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 # --- Product Schemas ---
@@ -22,21 +22,57 @@ class Product(ProductBase):
     # FIX: Use model_config instead of class Config
     model_config = ConfigDict(from_attributes=True)
 
+class ProductPage(BaseModel):
+    """
+    One page of the product catalogue.
+    Pass 'next_cursor' back as 'cursor' to fetch the following page.
+    """
+    items: List[Product]
+    next_cursor: Optional[int] = None
+
+class ProductImportResult(BaseModel):
+    inserted: int
+    updated: int
+
 # --- Configuration Schemas ---
 class ConfigurationBase(BaseModel):
     name: str
     input_params: Dict[str, Any]
-    results: Optional[Dict[str, Any]] = None
+    # No 'results': they are always simulated server-side from 'input_params'
 
 class ConfigurationCreate(ConfigurationBase):
     pass
 
-class Configuration(ConfigurationBase):
+class ConfigurationBulkCreate(BaseModel):
+    """
+    Payload for saving many configurations in a single batched insert.
+    """
+    items: List[ConfigurationCreate] = Field(..., min_length=1, max_length=1000)
+
+class ConfigurationSummary(BaseModel):
+    """
+    Lightweight listing row (no hourly chart data).
+    """
     id: int
+    name: str
+    input_params: Dict[str, Any]
+    latitude: Optional[float] = None
+    lcoe_cents_kwh: Optional[float] = None
+    total_capex_usd: Optional[float] = None
     created_at: datetime
-    # FIX: Use model_config instead of class Config
     model_config = ConfigDict(from_attributes=True)
 
+class Configuration(ConfigurationSummary):
+    results: Optional[Dict[str, Any]] = None
+
+class ConfigurationPage(BaseModel):
+    """
+    One page of saved configurations.
+    Pass 'next_cursor' back as 'cursor' to fetch the following page.
+    """
+    items: List[ConfigurationSummary]
+    next_cursor: Optional[str] = None
+
 # --- Simulation / Calculation Schemas ---
 
 class CalculationRequest(BaseModel):
@@ -73,6 +109,8 @@ class CalculationResponse(BaseModel):
     """
     kpis: SimulationKPIs
     charts: list[SimulationFrame]
+    # Handle for reusing these KPIs in /api/generate-proposal (expires after a TTL)
+    result_id: Optional[str] = None
 
 # --- AI Proposal Schemas ---
 
@@ -81,6 +119,7 @@ class ProposalRequest(BaseModel):
     solar_mw: float
     battery_mwh: float
     latitude: float = 0.0
+    result_id: Optional[str] = None
 
 class ProposalResponse(BaseModel):
     proposal_text: str
\ No newline at end of file
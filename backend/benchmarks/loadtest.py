@@ -0,0 +1,229 @@
+"""
+Async Load-Test Harness
+-----------------------
+Drives the API with realistic mixed traffic at increasing concurrency and reports
+throughput, p50/p95/p99 latency and event-loop lag per level.
+
+Traffic mix (per virtual sales rep):
+- Slider-driven /api/calculate (inputs random-walk like a rep dragging sliders)
+- Occasional /api/generate-proposal, reusing the last result_id (local fake LLM)
+- /products catalogue reads, revalidated with If-None-Match like a browser cache
+
+Runs fully offline. By default the app runs in-process (ASGI transport) on a temporary
+SQLite file; set DATABASE_URL for a local Postgres, or pass --base-url to target a local
+uvicorn started with LLM_PROVIDER=fake.
+
+Usage (from backend/):
+    python -m benchmarks.loadtest --concurrency 1,8,32,64 --duration 10 --llm-delay-ms 800
+    python -m benchmarks.loadtest --base-url http://localhost:8000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+import numpy as np
+
+DEFAULT_MIX = {"calculate": 0.85, "products": 0.12, "proposal": 0.03}
+
+class Rep:
+    """
+    One virtual sales rep: keeps its own slider state, last result_id and product ETag.
+    """
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.inputs = {
+            "num_engines": rng.randint(1, 10),
+            "solar_mw": float(rng.randrange(0, 200, 5)),
+            "battery_mwh": float(rng.randrange(0, 100, 5)),
+            "latitude": float(rng.randint(-60, 60)),
+        }
+        self.result_id = None
+        self.etag = None
+
+    def move_slider(self):
+        key = self.rng.choice(list(self.inputs))
+        if key == "num_engines":
+            self.inputs[key] = min(20, max(0, self.inputs[key] + self.rng.choice((-1, 1))))
+        elif key == "latitude":
+            self.inputs[key] = min(70.0, max(-70.0, self.inputs[key] + self.rng.choice((-5, 5))))
+        else:
+            self.inputs[key] = max(0.0, self.inputs[key] + self.rng.choice((-5, 5)))
+
+    async def calculate(self, client: httpx.AsyncClient) -> httpx.Response:
+        self.move_slider()
+        response = await client.post("/api/calculate", json=self.inputs)
+        if response.status_code == 200:
+            self.result_id = response.json().get("result_id")
+        return response
+
+    async def proposal(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.post("/api/generate-proposal", json={**self.inputs, "result_id": self.result_id})
+
+    async def products(self, client: httpx.AsyncClient) -> httpx.Response:
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        response = await client.get("/products", params={"category": "engine"}, headers=headers)
+        self.etag = response.headers.get("etag", self.etag)
+        return response
+
+def _percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    if not samples_ms:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    p50, p95, p99 = np.percentile(samples_ms, [50, 95, 99])
+    return {"p50_ms": round(float(p50), 2), "p95_ms": round(float(p95), 2), "p99_ms": round(float(p99), 2)}
+
+async def _monitor_loop_lag(stop: asyncio.Event, samples_ms: List[float], interval: float = 0.01):
+    """
+    Measures how late a short sleep wakes up: a direct read of event-loop blocking.
+    """
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples_ms.append(max(0.0, (time.perf_counter() - start - interval) * 1000))
+
+async def run_level(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    duration: float,
+    mix: Dict[str, float] = DEFAULT_MIX,
+    think_ms: float = 0.0,
+    seed: int = 0,
+) -> dict:
+    """
+    Runs 'concurrency' reps in a closed loop for 'duration' seconds.
+    """
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    lag_ms: List[float] = []
+    operations, weights = zip(*mix.items())
+    deadline = time.perf_counter() + duration
+
+    async def rep_loop(index: int):
+        rng = random.Random(seed * 10_007 + index)
+        rep = Rep(rng)
+        while time.perf_counter() < deadline:
+            operation = rng.choices(operations, weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await getattr(rep, operation)(client)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies[operation].append((time.perf_counter() - start) * 1000)
+            if not ok:
+                errors[operation] += 1
+            if think_ms:
+                await asyncio.sleep(rng.expovariate(1000 / think_ms))
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_loop_lag(stop, lag_ms))
+    started = time.perf_counter()
+    await asyncio.gather(*(rep_loop(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+
+    all_latencies = [sample for samples in latencies.values() for sample in samples]
+    lag = _percentiles(lag_ms)
+    return {
+        "concurrency": concurrency,
+        "requests": len(all_latencies),
+        "errors": sum(errors.values()),
+        "throughput_rps": round(len(all_latencies) / elapsed, 1),
+        **_percentiles(all_latencies),
+        "loop_lag_p50_ms": lag["p50_ms"],
+        "loop_lag_p99_ms": lag["p99_ms"],
+        "loop_lag_max_ms": round(max(lag_ms, default=0.0), 2),
+        "endpoints": {
+            operation: {"requests": len(samples), "errors": errors[operation], **_percentiles(samples)}
+            for operation, samples in sorted(latencies.items())
+        },
+    }
+
+@asynccontextmanager
+async def _in_process_client(llm_delay_ms: float):
+    """
+    Boots the FastAPI app (lifespan included) behind an in-memory ASGI transport.
+    """
+    from app import ai_service
+    from app.fake_llm import FakeProposalLLM
+    from app.main import app, lifespan
+
+    ai_service.llm = FakeProposalLLM(delay_seconds=llm_delay_ms / 1000)
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://hyperion.local", timeout=60) as client:
+            yield client
+
+def _print_report(levels: List[dict], mode: str):
+    print(f"\nMode: {mode}  (loop lag is the {'server' if mode == 'in-process' else 'load generator'} event loop)")
+    print(f"{'conc':>5}{'reqs':>8}{'errs':>6}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'lag p99':>9}{'lag max':>9}")
+    for level in levels:
+        print(
+            f"{level['concurrency']:>5}{level['requests']:>8}{level['errors']:>6}{level['throughput_rps']:>9.1f}"
+            f"{level['p50_ms']:>9.1f}{level['p95_ms']:>9.1f}{level['p99_ms']:>9.1f}"
+            f"{level['loop_lag_p99_ms']:>9.1f}{level['loop_lag_max_ms']:>9.1f}"
+        )
+    print("\nPer endpoint (highest concurrency):")
+    for operation, stats in levels[-1]["endpoints"].items():
+        print(f"  {operation:<10} n={stats['requests']:<7} errors={stats['errors']:<4} "
+              f"p50={stats['p50_ms']:.1f}ms p95={stats['p95_ms']:.1f}ms p99={stats['p99_ms']:.1f}ms")
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, weight = part.split("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{name}'")
+        mix[name] = float(weight)
+    return mix
+
+async def main_async(args) -> List[dict]:
+    levels = []
+    if args.base_url:
+        mode = "remote"
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+            for concurrency in args.concurrency:
+                levels.append(await run_level(client, concurrency, args.duration, args.mix, args.think_ms, args.seed))
+    else:
+        mode = "in-process"
+        async with _in_process_client(args.llm_delay_ms) as client:
+            for concurrency in args.concurrency:
+                levels.append(await run_level(client, concurrency, args.duration, args.mix, args.think_ms, args.seed))
+
+    _print_report(levels, mode)
+    return levels
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hyperion mixed-traffic load test")
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=lambda s: [int(x) for x in s.split(",")], default=[1, 4, 16, 64])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--mix", type=_parse_mix, default=DEFAULT_MIX, help="e.g. calculate=0.85,products=0.12,proposal=0.03")
+    parser.add_argument("--llm-delay-ms", type=float, default=800.0, help="Fake LLM latency (in-process mode)")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between a rep's requests")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="Write the full report here")
+    args = parser.parse_args(argv)
+
+    if not args.base_url:
+        # Must be set before the app modules are imported
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/loadtest.db")
+        os.environ.setdefault("LLM_PROVIDER", "fake")
+
+    levels = asyncio.run(main_async(args))
+    if args.json:
+        args.json.write_text(json.dumps(levels, indent=2) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
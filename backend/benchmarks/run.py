@@ -0,0 +1,298 @@
+"""
+Performance Benchmark Suite
+---------------------------
+Times the physics engine and the main API paths, compares p50/p99 against a stored
+JSON baseline, and exits non-zero when a case regresses beyond the tolerance.
+
+Each case is warmed up, then timed in several rounds that interleave all cases
+(round-robin), and the reported p50/p99 are the medians of the per-round values.
+This damps CPU frequency ramp-up, GC pauses and case-order bias.
+
+A fixed 'calibration' workload runs in every round. Baseline limits are scaled by
+its current/baseline ratio, so a uniformly slower (or throttled, shared) machine
+doesn't read as a regression.
+
+Runs fully offline: the API cases use the in-memory SQLite override from
+tests/conftest.py and the local fake LLM.
+
+Usage (from backend/):
+    python -m benchmarks.run                      # compare against baseline.json
+    python -m benchmarks.run --update-baseline    # record a new baseline
+    python -m benchmarks.run --only api_ --tolerance 0.5
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Must be set before the app modules are imported
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+
+import numpy as np
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Allowed slowdown vs. baseline before a case fails (0.3 = 30% slower)
+DEFAULT_P50_TOLERANCE = 0.30
+DEFAULT_P99_TOLERANCE = 0.60
+
+# Timed rounds per case; the median of the per-round percentiles is reported
+DEFAULT_REPEATS = 5
+
+CALIBRATION_CASE = "calibration"
+
+ENGINE_SPECS = {"nominal_power_mw": 12.0, "electrical_efficiency": 0.51, "capex_per_kw": 800}
+
+class Case:
+    """
+    One benchmark: each round takes 'iterations' samples; a sample times 'inner' calls of 'fn'
+    (use inner > 1 for microsecond-scale cases, where timer noise would dominate a single call).
+    Warm-up runs at least 'warmup' untimed calls and at least 'warmup_seconds'.
+    """
+    def __init__(self, name: str, fn: Callable[[], object], iterations: int, warmup: int = 50,
+                 warmup_seconds: float = 0.25, inner: int = 1):
+        self.name = name
+        self.fn = fn
+        self.iterations = iterations
+        self.inner = inner
+        self.warmup = warmup
+        self.warmup_seconds = warmup_seconds
+        self.rounds: List[np.ndarray] = []
+
+    def warm_up(self):
+        deadline = time.perf_counter() + self.warmup_seconds
+        calls = 0
+        while calls < self.warmup or time.perf_counter() < deadline:
+            self.fn()
+            calls += 1
+
+    def run_round(self):
+        timings = np.empty(self.iterations)
+        for i in range(self.iterations):
+            start = time.perf_counter()
+            for _ in range(self.inner):
+                self.fn()
+            timings[i] = time.perf_counter() - start
+        self.rounds.append(timings * 1000 / self.inner)  # ms per call
+
+    def stats(self) -> Dict[str, float]:
+        p50s = [np.percentile(timings, 50) for timings in self.rounds]
+        p99s = [np.percentile(timings, 99) for timings in self.rounds]
+        return {
+            "iterations": self.iterations,
+            "repeats": len(self.rounds),
+            "p50_ms": round(float(np.median(p50s)), 4),
+            "p99_ms": round(float(np.median(p99s)), 4),
+            "mean_ms": round(float(np.concatenate(self.rounds).mean()), 4),
+        }
+
+def run_cases(cases: List[Case], repeats: int = DEFAULT_REPEATS) -> Dict[str, dict]:
+    """
+    Warms every case up, then times them round-robin so slow drift hits all cases alike.
+    """
+    for case in cases:
+        case.warm_up()
+    for _ in range(repeats):
+        for case in cases:
+            # Re-warm briefly: the previous case may have evicted this one's caches
+            for _ in range(min(case.warmup, 5)):
+                case.fn()
+            case.run_round()
+    return {case.name: case.stats() for case in cases}
+
+# -----------------------------------------------------------------------------
+# Cases
+# -----------------------------------------------------------------------------
+def _calibration_case() -> Case:
+    """
+    Fixed reference work with the same ingredients as the engine (Python, NumPy, pandas).
+    Its timing tracks machine speed only; it never changes with the code under test.
+    """
+    import pandas as pd
+
+    values = np.random.default_rng(0).uniform(0, 1, 24 * 64)
+
+    def workload():
+        frame = pd.DataFrame({"x": values})
+        frame["y"] = np.sqrt(frame["x"]) * 2.0
+        frame["z"] = frame["y"].clip(upper=1.0).cumsum()
+        return sum(i * i for i in range(2_000)) + float(frame["z"].iloc[-1])
+
+    return Case(CALIBRATION_CASE, workload, iterations=300)
+
+def _engine_cases() -> List[Case]:
+    from app import calculations
+
+    sizes = {
+        "small": dict(num_engines=1, solar_mw=5, battery_mwh=0),
+        "medium": dict(num_engines=4, solar_mw=50, battery_mwh=10),
+        "large": dict(num_engines=20, solar_mw=400, battery_mwh=200),
+    }
+    cases = [Case("solar_geometry", lambda: calculations.calculate_solar_geometry(45.0), iterations=200, inner=100)]
+    for label, params in sizes.items():
+        cases.append(Case(
+            f"hybrid_performance_{label}",
+            lambda p=params: calculations.calculate_hybrid_performance(engine_specs=ENGINE_SPECS, latitude=35.0, **p),
+            iterations=300
+        ))
+
+    rng = np.random.default_rng(42)
+    for count, iterations, inner in [(1_000, 100, 10), (100_000, 20, 1)]:
+        sweep = (
+            rng.integers(0, 20, count),
+            rng.uniform(0, 400, count),
+            rng.uniform(0, 200, count),
+            rng.uniform(-70, 70, count),
+        )
+        cases.append(Case(
+            f"batch_sweep_{count}",
+            lambda s=sweep: calculations.calculate_kpis_batch(s[0], s[1], s[2], ENGINE_SPECS, latitude=s[3]),
+            iterations=iterations,
+            warmup=3,
+            inner=inner
+        ))
+    return cases
+
+def _api_cases(stack) -> List[Case]:
+    from fastapi.testclient import TestClient
+    from app import ai_service
+    from app.concurrency import TokenBucket
+    from app.fake_llm import FakeProposalLLM
+    from app.main import app
+    from app.models import Product
+    from tests.conftest import Base, TestingSessionLocal, engine  # installs the SQLite get_db override
+
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    if not db.query(Product).filter(Product.category == "engine").first():
+        db.add(Product(name="Benchmark Engine", category="engine", specs=ENGINE_SPECS))
+        db.commit()
+    db.close()
+
+    # Stubbed LLM and no provider rate limit: measures our overhead, not the provider's
+    ai_service.llm = FakeProposalLLM()
+    ai_service.rate_limiter = TokenBucket(rate=0, capacity=1)
+    client = stack.enter_context(TestClient(app))
+    payload = {"num_engines": 4, "solar_mw": 50, "battery_mwh": 10, "latitude": 35.0}
+    # Fresh inputs on every call, so the cold cases always miss the simulation cache
+    fresh = itertools.count()
+
+    def post(path, cold=True):
+        body = {**payload, "solar_mw": 50 + next(fresh) * 0.001} if cold else payload
+        response = client.post(path, json=body)
+        response.raise_for_status()
+
+    return [
+        Case("api_calculate", lambda: post("/api/calculate"), iterations=300),
+        Case("api_calculate_cached", lambda: post("/api/calculate", cold=False), iterations=300),
+        Case("api_generate_proposal", lambda: post("/api/generate-proposal"), iterations=200),
+    ]
+
+# -----------------------------------------------------------------------------
+# Baseline comparison
+# -----------------------------------------------------------------------------
+def speed_factor(results: Dict[str, dict], baseline: Dict[str, dict]) -> float:
+    """
+    How much slower this machine currently is than when the baseline was recorded (1.0 = same).
+    """
+    current, reference = results.get(CALIBRATION_CASE), baseline.get(CALIBRATION_CASE)
+    if not current or not reference:
+        return 1.0
+    return current["p50_ms"] / reference["p50_ms"]
+
+def compare(
+    results: Dict[str, dict],
+    baseline: Dict[str, dict],
+    p50_tolerance: float = DEFAULT_P50_TOLERANCE,
+    p99_tolerance: float = DEFAULT_P99_TOLERANCE,
+    speed: float = 1.0,
+) -> List[str]:
+    """
+    Returns one message per regressed metric (empty list = pass).
+    Baseline timings are scaled by 'speed' (see speed_factor). Cases missing from
+    the baseline, and the calibration case itself, are not judged.
+    """
+    failures = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None or name == CALIBRATION_CASE:
+            continue
+        for metric, tolerance in (("p50_ms", p50_tolerance), ("p99_ms", p99_tolerance)):
+            limit = reference[metric] * speed * (1 + tolerance)
+            if current[metric] > limit:
+                failures.append(
+                    f"{name}: {metric} {current[metric]:.3f}ms > {limit:.3f}ms "
+                    f"(baseline {reference[metric]:.3f}ms x{speed:.2f} speed +{tolerance:.0%})"
+                )
+    return failures
+
+def _environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "numpy": np.__version__,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from contextlib import ExitStack
+
+    parser = argparse.ArgumentParser(description="Hyperion performance benchmarks")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_P50_TOLERANCE, help="Allowed p50 slowdown (fraction)")
+    parser.add_argument("--p99-tolerance", type=float, default=DEFAULT_P99_TOLERANCE, help="Allowed p99 slowdown (fraction)")
+    parser.add_argument("--only", help="Run only cases whose name starts with this prefix")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Timed rounds per case")
+    parser.add_argument("--output", type=Path, help="Also write results JSON here")
+    args = parser.parse_args(argv)
+
+    with ExitStack() as stack:
+        cases = _engine_cases() + _api_cases(stack)
+        if args.only:
+            cases = [c for c in cases if c.name.startswith(args.only)]
+        cases.insert(0, _calibration_case())
+
+        results = run_cases(cases, args.repeats)
+
+    print(f"{'case':<28}{'p50 (ms)':>12}{'p99 (ms)':>12}{'mean (ms)':>12}")
+    for name, stats in results.items():
+        print(f"{name:<28}{stats['p50_ms']:>12.3f}{stats['p99_ms']:>12.3f}{stats['mean_ms']:>12.3f}")
+
+    report = {"environment": _environment(), "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✅ Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline first.")
+        return 0
+
+    stored = json.loads(args.baseline.read_text())
+    if stored.get("environment") != report["environment"]:
+        print(f"⚠️  Baseline was recorded on {stored.get('environment')}; comparisons may be noisy.")
+
+    speed = speed_factor(results, stored.get("results", {}))
+    print(f"Machine speed vs. baseline: x{speed:.2f} (calibration case; >1 = slower now)")
+    failures = compare(results, stored.get("results", {}), args.tolerance, args.p99_tolerance, speed)
+    if failures:
+        print("❌ Performance regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("✅ No regressions against baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
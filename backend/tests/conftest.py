@@ -10,6 +10,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.cache import cache, invalidate_catalogue_version
 from app.database import Base, get_db
 from app.models import Product # Import the model
 
@@ -33,6 +34,15 @@ def override_get_db():
 
 app.dependency_overrides[get_db] = override_get_db
 
+@pytest.fixture(autouse=True)
+def reset_cache():
+    """
+    Each test sees a cold cache (tests seed and drop products directly, bypassing invalidation).
+    """
+    cache.clear()
+    invalidate_catalogue_version()
+    yield
+
 @pytest.fixture(scope="module")
 def client():
     """
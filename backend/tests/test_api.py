@@ -60,4 +60,49 @@ def test_ai_proposal_mock(mock_ai, client):
     assert data["proposal_text"] == "This is a mocked AI proposal for testing."
     
     # Verify our mock was actually called once
-    mock_ai.assert_called_once()
\ No newline at end of file
+    mock_ai.assert_called_once()
+
+@patch("app.ai_service.generate_proposal_text")
+def test_proposal_reuses_calculation_result(mock_ai, client):
+    """
+    A 'result_id' from /api/calculate lets the proposal skip the simulation entirely.
+    """
+    mock_ai.return_value = "Reused KPIs."
+    payload = {"num_engines": 4, "solar_mw": 50, "battery_mwh": 10, "latitude": 12.5}
+
+    calc = client.post("/api/calculate", json=payload).json()
+    assert calc["result_id"]
+
+    with patch("app.calculations.calculate_hybrid_performance") as mock_sim:
+        response = client.post("/api/generate-proposal", json={**payload, "result_id": calc["result_id"]})
+        mock_sim.assert_not_called()
+
+    assert response.json()["proposal_text"] == "Reused KPIs."
+    assert mock_ai.call_args.kwargs["kpis"] == calc["kpis"]
+
+@patch("app.ai_service.generate_proposal_text")
+def test_proposal_recomputes_on_stale_result_id(mock_ai, client):
+    """
+    Unknown handles, or handles for different inputs, fall back to running the simulation.
+    """
+    mock_ai.return_value = "Recomputed KPIs."
+    payload = {"num_engines": 4, "solar_mw": 50, "battery_mwh": 10}
+    calc = client.post("/api/calculate", json=payload).json()
+
+    for result_id, solar_mw in [("unknown-handle", 50), (calc["result_id"], 80)]:
+        response = client.post("/api/generate-proposal", json={**payload, "solar_mw": solar_mw, "result_id": result_id})
+        assert response.json()["proposal_text"] == "Recomputed KPIs."
+
+    assert mock_ai.call_args.kwargs["kpis"] != calc["kpis"]
+
+@patch("app.ai_service.generate_proposal_text")
+def test_proposal_fallback_when_simulation_fails(mock_ai, client):
+    """
+    The error fallback must not depend on a simulation result that never existed.
+    """
+    with patch("app.calculations.calculate_hybrid_performance", side_effect=ValueError("bad specs")):
+        response = client.post("/api/generate-proposal", json={"num_engines": 4, "solar_mw": 50, "battery_mwh": 10})
+
+    assert response.status_code == 200
+    assert "bad specs" in response.json()["proposal_text"]
+    mock_ai.assert_not_called()
@@ -0,0 +1,31 @@
+"""
+Unit Tests for the Benchmark Regression Gate
+--------------------------------------------
+Verifies baseline comparison logic (the timings themselves run via `make bench`).
+"""
+from benchmarks.run import CALIBRATION_CASE, compare, speed_factor
+
+BASELINE = {"api_calculate": {"p50_ms": 10.0, "p99_ms": 20.0}}
+
+def test_within_tolerance_passes():
+    results = {"api_calculate": {"p50_ms": 12.9, "p99_ms": 31.0}}
+    assert compare(results, BASELINE, p50_tolerance=0.3, p99_tolerance=0.6) == []
+
+def test_p50_and_p99_regressions_reported():
+    results = {"api_calculate": {"p50_ms": 13.5, "p99_ms": 40.0}}
+    failures = compare(results, BASELINE, p50_tolerance=0.3, p99_tolerance=0.6)
+    assert len(failures) == 2
+    assert failures[0].startswith("api_calculate: p50_ms")
+
+def test_new_cases_are_not_judged():
+    assert compare({"new_case": {"p50_ms": 1e9, "p99_ms": 1e9}}, BASELINE) == []
+
+def test_limits_scale_with_machine_speed():
+    baseline = {**BASELINE, CALIBRATION_CASE: {"p50_ms": 1.0, "p99_ms": 1.0}}
+    results = {"api_calculate": {"p50_ms": 18.0, "p99_ms": 30.0}, CALIBRATION_CASE: {"p50_ms": 1.5, "p99_ms": 1.5}}
+
+    speed = speed_factor(results, baseline)
+    assert speed == 1.5
+    # 18ms is a regression on the baseline machine, but not on one running 1.5x slower
+    assert compare(results, baseline, speed=1.0) != []
+    assert compare(results, baseline, speed=speed) == []
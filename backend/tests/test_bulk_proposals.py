@@ -0,0 +1,104 @@
+"""
+Integration Tests for Bulk Proposal Generation
+----------------------------------------------
+Runs fully offline against the local fake LLM or mocked provider calls.
+"""
+import asyncio
+import json
+import time
+
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app import ai_service
+from app.concurrency import TokenBucket
+from app.fake_llm import FakeProposalLLM
+
+def _items(n):
+    return [
+        {"num_engines": 4, "solar_mw": 10 + i, "battery_mwh": 10, "latitude": i % 60}
+        for i in range(n)
+    ]
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+@pytest.fixture
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(ai_service, "rate_limiter", TokenBucket(rate=0, capacity=1))
+    monkeypatch.setattr(ai_service, "LLM_RETRY_BASE_DELAY", 0)
+
+def test_bulk_streams_every_item_with_fake_llm(client, no_rate_limit, monkeypatch):
+    monkeypatch.setattr(ai_service, "llm", FakeProposalLLM(delay_seconds=0.01))
+
+    response = client.post("/api/generate-proposal/bulk", json={"items": _items(12), "max_concurrency": 4})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = _lines(response)
+    assert sorted(r["index"] for r in results) == list(range(12))
+    assert all(r["status"] == "ok" for r in results)
+    assert all(r["proposal_text"].startswith("[Offline draft") for r in results)
+    assert all(r["kpis"]["total_capex_usd"] > 0 for r in results)
+
+def test_bulk_respects_concurrency_limit(client, no_rate_limit):
+    in_flight = 0
+    peak = 0
+
+    async def slow_generate(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok"
+
+    with patch("app.ai_service.generate_proposal_text", side_effect=slow_generate):
+        response = client.post("/api/generate-proposal/bulk", json={"items": _items(10), "max_concurrency": 3})
+
+    assert len(_lines(response)) == 10
+    assert peak == 3
+
+def test_bulk_retries_transient_errors(client, no_rate_limit):
+    transient = openai.APIConnectionError(request=httpx.Request("POST", "http://llm.local"))
+    mock_ai = AsyncMock(side_effect=[transient, transient, "Recovered proposal"])
+
+    with patch("app.ai_service.generate_proposal_text", mock_ai):
+        response = client.post("/api/generate-proposal/bulk", json={"items": _items(1)})
+
+    [result] = _lines(response)
+    assert result["status"] == "ok"
+    assert result["proposal_text"] == "Recovered proposal"
+    assert mock_ai.call_count == 3
+
+def test_bulk_falls_back_on_permanent_errors(client, no_rate_limit):
+    mock_ai = AsyncMock(side_effect=ValueError("bad prompt"))
+
+    with patch("app.ai_service.generate_proposal_text", mock_ai):
+        response = client.post("/api/generate-proposal/bulk", json={"items": _items(2)})
+
+    results = _lines(response)
+    assert all(r["status"] == "error" for r in results)
+    assert all("tons of CO2 savings" in r["proposal_text"] for r in results)
+    # Non-transient errors are not retried
+    assert mock_ai.call_count == 2
+
+def test_token_bucket_limits_rate():
+    async def run():
+        bucket = TokenBucket(rate=100, capacity=2)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # 2 burst tokens, then 4 more at 100/s -> at least ~40ms
+    assert asyncio.run(run()) >= 0.035
+
+def test_single_proposal_uses_shared_rate_limiter(client):
+    with patch("app.ai_service.generate_proposal_text", return_value="ok"), \
+         patch.object(ai_service.rate_limiter, "acquire") as mock_acquire:
+        response = client.post("/api/generate-proposal", json={"num_engines": 2, "solar_mw": 10, "battery_mwh": 0})
+    assert response.json() == {"proposal_text": "ok"}
+    mock_acquire.assert_awaited_once()
@@ -0,0 +1,91 @@
+"""
+Tests for the Shared Cache
+--------------------------
+Verifies cross-worker sharing through the SQLite tier, L1 promotion, TTL expiry,
+and catalogue-version invalidation of cached simulations.
+"""
+import json
+from unittest.mock import patch
+
+from app import metrics
+from app.cache import MemoryCache, SQLiteCache, TieredCache, cached_engine_specs, catalogue_version
+from app.models import Product
+from tests.conftest import TestingSessionLocal
+
+PAYLOAD = {"num_engines": 3, "solar_mw": 40, "battery_mwh": 5, "latitude": 20.0}
+
+def _worker(path):
+    """One uvicorn worker's view: private L1, shared L2 file."""
+    return TieredCache(MemoryCache(max_entries=16), SQLiteCache(str(path)))
+
+def test_sqlite_tier_is_shared_between_workers(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    worker_a, worker_b = _worker(path), _worker(path)
+
+    worker_a.set("simulation:v1:abc", {"kpis": {"lcoe_cents_kwh": 7.5}})
+
+    assert worker_b.l1.get("simulation:v1:abc") is None
+    assert worker_b.get("simulation:v1:abc") == {"kpis": {"lcoe_cents_kwh": 7.5}}
+    # Promoted: the next read on worker B never touches SQLite
+    assert worker_b.l1.get("simulation:v1:abc") == {"kpis": {"lcoe_cents_kwh": 7.5}}
+
+def test_sqlite_entries_expire(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), default_ttl=10)
+    with patch("app.cache.time.time", return_value=1_000.0):
+        cache.set("key", [1, 2, 3])
+        assert cache.get("key") == [1, 2, 3]
+    with patch("app.cache.time.time", return_value=1_011.0):
+        assert cache.get("key") is None
+
+def test_proposal_with_foreign_result_id_uses_simulation_cache(client):
+    """
+    A handle issued by another worker misses the local store but not the shared simulation cache.
+    """
+    client.post("/api/calculate", json=PAYLOAD)
+
+    with patch("app.ai_service.generate_proposal_text", return_value="ok"), \
+         patch("app.calculations.calculate_hybrid_performance") as mock_sim:
+        response = client.post("/api/generate-proposal", json={**PAYLOAD, "result_id": "issued-by-another-worker"})
+        mock_sim.assert_not_called()
+    assert response.json() == {"proposal_text": "ok"}
+
+def test_repeat_calculation_is_served_from_cache(client):
+    first = client.post("/api/calculate", json=PAYLOAD).json()
+    hits = metrics.cache_requests.value(cache="cache_l1", result="hit")
+    second = client.post("/api/calculate", json=PAYLOAD).json()
+
+    assert metrics.cache_requests.value(cache="cache_l1", result="hit") > hits
+    assert second["kpis"] == first["kpis"]
+    assert second["result_id"] != first["result_id"]
+
+def test_product_import_invalidates_cached_simulations(client):
+    before = client.post("/api/calculate", json=PAYLOAD).json()["kpis"]
+
+    row = {
+        "name": "Test Engine 31SG",
+        "category": "engine",
+        "specs": {"nominal_power_mw": 12.0, "electrical_efficiency": 0.51, "capex_per_kw": 1600},
+    }
+    response = client.post(
+        "/products/import",
+        files={"file": ("engine.jsonl", json.dumps(row) + "\n", "application/x-ndjson")}
+    )
+    assert response.json() == {"inserted": 0, "updated": 1}
+
+    after = client.post("/api/calculate", json=PAYLOAD).json()["kpis"]
+    assert after["total_capex_usd"] > before["total_capex_usd"]
+
+def test_catalogue_reads_leave_caller_session_alone(client):
+    db = TestingSessionLocal()
+    try:
+        draft = Product(name="Pending SKU", category="solar", specs={})
+        db.add(draft)
+
+        catalogue_version(db)
+        assert cached_engine_specs(db) is not None
+
+        assert draft in db.new  # Not rolled back or expunged
+        db.commit()
+        assert db.query(Product).filter(Product.name == "Pending SKU").count() == 1
+    finally:
+        db.close()
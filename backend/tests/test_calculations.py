@@ -109,4 +109,24 @@ def test_geospatial_impact():
     peak_fin = max(x['solar_mw'] for x in res_fin['charts'])
     
     # Physics check: Sun is lower in Finland -> Less Power
-    assert peak_fin < peak_eq
\ No newline at end of file
+    assert peak_fin < peak_eq
+
+def test_batch_kpis_match_single_runs():
+    """
+    The vectorized batch path must agree with the per-scenario DataFrame simulation.
+    """
+    scenarios = [
+        (4, 20, 10, 0),
+        (1, 0, 0, 35),
+        (10, 80, 40, -20),
+        (0, 50, 0, 60),
+    ]
+    engines, solar, battery, lat = zip(*scenarios)
+    batch = calculations.calculate_kpis_batch(engines, solar, battery, MOCK_SPECS, latitude=lat)
+
+    for i, (n, s, b, l) in enumerate(scenarios):
+        single = calculations.calculate_hybrid_performance(
+            num_engines=n, solar_mw=s, battery_mwh=b, engine_specs=MOCK_SPECS, latitude=l
+        )["kpis"]
+        for key, value in single.items():
+            assert abs(batch[key][i] - value) < 1e-6
@@ -0,0 +1,112 @@
+"""
+Integration Tests for Saved Configurations
+------------------------------------------
+Tests CRUD, batched saves, keyset pagination and KPI filters.
+"""
+from unittest.mock import patch
+
+def _payload(name, num_engines=4, solar_mw=50, battery_mwh=10, latitude=0.0):
+    return {
+        "name": name,
+        "input_params": {
+            "num_engines": num_engines,
+            "solar_mw": solar_mw,
+            "battery_mwh": battery_mwh,
+            "latitude": latitude
+        }
+    }
+
+def test_create_and_load_configuration(client):
+    """
+    Saving runs the simulation once; loading returns the stored results without recomputing.
+    """
+    response = client.post("/api/configurations", json=_payload("Miami Plant", latitude=25.8))
+    assert response.status_code == 201
+    created = response.json()
+
+    assert len(created["results"]["charts"]) == 24
+    assert created["latitude"] == 25.8
+    assert created["lcoe_cents_kwh"] == created["results"]["kpis"]["lcoe_cents_kwh"]
+
+    with patch("app.calculations.calculate_hybrid_performance") as mock_sim:
+        response = client.get(f"/api/configurations/{created['id']}")
+        mock_sim.assert_not_called()
+
+    assert response.status_code == 200
+    assert response.json()["results"] == created["results"]
+
+def test_update_and_delete_configuration(client):
+    created = client.post("/api/configurations", json=_payload("Draft")).json()
+
+    response = client.put(f"/api/configurations/{created['id']}", json=_payload("Final", solar_mw=80))
+    assert response.status_code == 200
+    assert response.json()["name"] == "Final"
+    assert response.json()["input_params"]["solar_mw"] == 80
+
+    assert client.delete(f"/api/configurations/{created['id']}").status_code == 204
+    assert client.get(f"/api/configurations/{created['id']}").status_code == 404
+
+def test_invalid_input_params_rejected(client):
+    response = client.post("/api/configurations", json={"name": "Bad", "input_params": {"solar_mw": 5}})
+    assert response.status_code == 422
+
+def test_save_reuses_calculation_and_ignores_client_results(client):
+    """
+    Saving right after /api/calculate is a simulation-cache hit; client-sent results are never trusted.
+    """
+    calculated = client.post("/api/calculate", json=_payload("x")["input_params"]).json()
+    forged = {"kpis": {"lcoe_cents_kwh": 0.01, "total_capex_usd": 1.0, "annual_co2_savings_tons": 0.0}, "charts": []}
+
+    with patch("app.calculations.calculate_hybrid_performance") as mock_sim:
+        response = client.post("/api/configurations", json={**_payload("Reused"), "results": forged})
+        mock_sim.assert_not_called()
+
+    assert response.status_code == 201
+    assert response.json()["lcoe_cents_kwh"] == calculated["kpis"]["lcoe_cents_kwh"]
+    assert response.json()["results"]["kpis"] == calculated["kpis"]
+
+def test_bulk_save_and_keyset_pagination(client):
+    """
+    A bulk save shares one timestamp, so paging must fall back to the id tie-breaker.
+    """
+    items = [_payload(f"Sweep {i}", solar_mw=10 * i) for i in range(7)]
+    response = client.post("/api/configurations/bulk", json={"items": items})
+    assert response.status_code == 201
+    saved_ids = [c["id"] for c in response.json()]
+    assert len(saved_ids) == 7
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/configurations", params=params).json()
+        seen.extend(c["id"] for c in page["items"])
+        assert all("results" not in c for c in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen))
+    assert set(saved_ids) <= set(seen)
+    assert seen == sorted(seen, reverse=True)
+
+def test_list_filters_on_indexed_kpis(client):
+    client.post("/api/configurations/bulk", json={"items": [
+        _payload("Equator", latitude=0.0),
+        _payload("Finland", latitude=60.0),
+    ]})
+
+    page = client.get("/api/configurations", params={"min_latitude": 50}).json()
+    assert page["items"]
+    assert all(c["latitude"] >= 50 for c in page["items"])
+
+    all_items = client.get("/api/configurations", params={"limit": 200}).json()["items"]
+    threshold = min(c["lcoe_cents_kwh"] for c in all_items)
+    page = client.get("/api/configurations", params={"max_lcoe": threshold, "limit": 200}).json()
+    assert page["items"]
+    assert all(c["lcoe_cents_kwh"] <= threshold for c in page["items"])
+
+def test_invalid_cursor(client):
+    assert client.get("/api/configurations", params={"cursor": "not-a-cursor"}).status_code == 400
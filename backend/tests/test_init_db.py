@@ -0,0 +1,23 @@
+"""
+Tests for Database Initialization
+---------------------------------
+Verifies that databases created before newer columns existed are upgraded in place.
+"""
+from sqlalchemy import create_engine, inspect, text
+
+from app import init_db
+
+def test_add_missing_columns_upgrades_old_schema(tmp_path, monkeypatch):
+    old_engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with old_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE products (id INTEGER PRIMARY KEY, name VARCHAR UNIQUE, category VARCHAR, specs JSON)"))
+        conn.execute(text("INSERT INTO products (name, category, specs) VALUES ('Old Engine', 'engine', '{}')"))
+    monkeypatch.setattr(init_db, "engine", old_engine)
+
+    init_db.add_missing_columns()
+    init_db.add_missing_columns()  # Idempotent
+
+    columns = {column["name"] for column in inspect(old_engine).get_columns("products")}
+    assert "updated_at" in columns
+    with old_engine.connect() as conn:
+        assert conn.execute(text("SELECT updated_at FROM products")).scalar() is not None
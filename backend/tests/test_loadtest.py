@@ -0,0 +1,30 @@
+"""
+Smoke Test for the Load-Test Harness
+------------------------------------
+Runs a very short in-process level against the test database and the fake LLM.
+"""
+import asyncio
+
+import httpx
+
+from app import ai_service
+from app.fake_llm import FakeProposalLLM
+from app.main import app
+from benchmarks.loadtest import run_level
+
+def test_run_level_reports_latency_and_loop_lag(client, monkeypatch):
+    monkeypatch.setattr(ai_service, "llm", FakeProposalLLM(delay_seconds=0.005))
+    mix = {"calculate": 0.6, "products": 0.3, "proposal": 0.1}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await run_level(http, concurrency=4, duration=0.3, mix=mix)
+
+    report = asyncio.run(run())
+
+    assert report["requests"] > 0
+    assert report["errors"] == 0
+    assert report["p50_ms"] <= report["p95_ms"] <= report["p99_ms"]
+    assert report["loop_lag_max_ms"] >= 0
+    assert set(report["endpoints"]) <= set(mix)
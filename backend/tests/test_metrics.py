@@ -0,0 +1,59 @@
+"""
+Integration Tests for Latency Instrumentation
+---------------------------------------------
+Verifies the /metrics exposition, stage spans and the opt-in profiling hook.
+"""
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app import metrics
+from app.cache import cache
+from app.main import app
+
+PAYLOAD = {"num_engines": 4, "solar_mw": 50, "battery_mwh": 10}
+
+def test_metrics_exposes_request_and_stage_latency(client):
+    client.post("/api/calculate", json=PAYLOAD)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    body = response.text
+    assert 'hyperion_http_request_duration_seconds_count{method="POST",route="/api/calculate",status="200"}' in body
+    for stage in ("calculate.spec_lookup", "calculate.simulation", "calculate.serialize"):
+        assert f'hyperion_stage_duration_seconds_count{{stage="{stage}"}}' in body
+
+@patch("app.ai_service.generate_proposal_text")
+def test_metrics_tracks_result_store_hit_rate(mock_ai, client):
+    mock_ai.return_value = "ok"
+    before = metrics.cache_requests.value(cache="result_store", result="hit")
+
+    calc = client.post("/api/calculate", json=PAYLOAD).json()
+    client.post("/api/generate-proposal", json={**PAYLOAD, "result_id": calc["result_id"]})
+
+    assert metrics.cache_requests.value(cache="result_store", result="hit") == before + 1
+    assert 'hyperion_cache_hit_ratio{cache="result_store"}' in client.get("/metrics").text
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("test_seconds", "Test.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, stage="x")
+
+    lines = list(histogram.render())
+    assert 'test_seconds_bucket{stage="x",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="x",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{stage="x",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{stage="x"} 3' in lines
+
+def test_profiling_hook_is_opt_in(client):
+    # Disabled (default): the header is ignored
+    response = client.post("/api/calculate", json=PAYLOAD, headers={"X-Profile": "cprofile"})
+    assert "kpis" in response.json()
+
+    cache.clear()  # Profile a cold run, not the cached result of the call above
+    profiled = TestClient(metrics.TimingMiddleware(app, profiling_enabled=True))
+    response = profiled.post("/api/calculate", json=PAYLOAD, headers={"X-Profile": "cprofile"})
+    assert response.status_code == 200
+    assert response.headers["x-profiled-status"] == "200"
+    assert "calculate_hybrid_performance" in response.text
@@ -0,0 +1,106 @@
+"""
+Integration Tests for the Product Catalogue
+-------------------------------------------
+Tests bulk import, category filters, cursor pagination and HTTP caching.
+"""
+import json
+
+CSV_CATALOGUE = """name,category,nominal_power_mw,capex_per_kw
+Engine A,engine,10,800
+Engine B,engine,18.4,760
+Solar Block 1,solar,,700
+"""
+
+def _jsonl(rows):
+    return "\n".join(json.dumps(r) for r in rows) + "\n"
+
+def test_import_csv_and_filter_by_category(client):
+    response = client.post(
+        "/products/import",
+        files={"file": ("catalogue.csv", CSV_CATALOGUE, "text/csv")}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 3, "updated": 0}
+
+    page = client.get("/products", params={"category": "engine"}).json()
+    names = {p["name"] for p in page["items"]}
+    assert {"Engine A", "Engine B"} <= names
+    assert all(p["category"] == "engine" for p in page["items"])
+
+    engine_b = next(p for p in page["items"] if p["name"] == "Engine B")
+    assert engine_b["specs"] == {"nominal_power_mw": 18.4, "capex_per_kw": 760}
+
+def test_import_jsonl_upserts_by_name(client):
+    rows = [
+        {"name": "Engine A", "category": "engine", "specs": {"nominal_power_mw": 11}},
+        {"name": "BESS 4h", "category": "battery", "specs": {"capex_per_kwh": 300}},
+    ]
+    response = client.post(
+        "/products/import",
+        files={"file": ("catalogue.jsonl", _jsonl(rows), "application/x-ndjson")}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 1, "updated": 1}
+
+def test_import_rejects_malformed_rows(client):
+    response = client.post(
+        "/products/import",
+        files={"file": ("bad.jsonl", _jsonl([{"name": "No Category"}]), "application/x-ndjson")}
+    )
+    assert response.status_code == 400
+    assert "Row 1" in response.json()["detail"]
+
+    for line in ("[1, 2]", '"x"', '{"name": "N", "category": "engine", "specs": {"x": NaN}}'):
+        response = client.post("/products/import", files={"file": ("bad.jsonl", line + "\n", "application/x-ndjson")})
+        assert response.status_code == 400
+
+def test_csv_non_finite_cells_stay_text(client):
+    csv_text = "name,category,x,y\nOdd SKU,solar,nan,inf\n"
+    response = client.post("/products/import", files={"file": ("odd.csv", csv_text, "text/csv")})
+    assert response.status_code == 200
+
+    page = client.get("/products", params={"category": "solar"}).json()
+    odd = next(p for p in page["items"] if p["name"] == "Odd SKU")
+    assert odd["specs"] == {"x": "nan", "y": "inf"}
+
+def test_cursor_pagination(client):
+    rows = [{"name": f"PV SKU {i}", "category": "solar", "specs": {"capex_per_kw": 600 + i}} for i in range(25)]
+    client.post("/products/import", files={"file": ("pv.jsonl", _jsonl(rows), "application/x-ndjson")})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"category": "solar", "limit": 10}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = client.get("/products", params=params).json()
+        seen.extend(p["id"] for p in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == sorted(set(seen))
+    assert len(seen) >= 25
+
+def test_etag_and_conditional_requests(client):
+    response = client.get("/products", params={"category": "engine"})
+    etag = response.headers["etag"]
+    assert "last-modified" in response.headers
+
+    cached = client.get("/products", params={"category": "engine"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    cached = client.get(
+        "/products",
+        params={"category": "engine"},
+        headers={"If-Modified-Since": response.headers["last-modified"]}
+    )
+    assert cached.status_code == 304
+
+    # Catalogue changes invalidate the ETag
+    rows = [{"name": "Engine C", "category": "engine", "specs": {"nominal_power_mw": 9}}]
+    client.post("/products/import", files={"file": ("c.jsonl", _jsonl(rows), "application/x-ndjson")})
+    fresh = client.get("/products", params={"category": "engine"}, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
@@ -0,0 +1,44 @@
+"""
+Unit Tests for the Simulation Result Store
+------------------------------------------
+Verifies LRU bounds, TTL expiry and input matching.
+"""
+from unittest.mock import patch
+
+from app.result_store import ResultStore
+
+INPUTS = {"num_engines": 4, "solar_mw": 50.0, "battery_mwh": 10.0, "latitude": 0.0}
+KPIS = {"total_capex_usd": 1.0, "annual_co2_savings_tons": 2.0, "lcoe_cents_kwh": 3.0}
+
+def test_hit_and_input_mismatch():
+    store = ResultStore()
+    handle = store.put(INPUTS, KPIS)
+
+    assert store.get_kpis(handle, INPUTS) == KPIS
+    assert store.get_kpis(handle, {**INPUTS, "solar_mw": 60.0}) is None
+    assert (store.hits, store.misses) == (1, 1)
+
+def test_evicts_least_recently_used():
+    store = ResultStore(max_entries=2)
+    first = store.put(INPUTS, KPIS)
+    second = store.put(INPUTS, KPIS)
+    store.get_kpis(first, INPUTS)  # 'first' is now most recently used
+    store.put(INPUTS, KPIS)
+
+    assert len(store) == 2
+    assert store.get_kpis(first, INPUTS) == KPIS
+    assert store.get_kpis(second, INPUTS) is None
+
+def test_entries_expire():
+    store = ResultStore(ttl_seconds=10)
+    with patch("app.cache.time.monotonic", return_value=100.0):
+        handle = store.put(INPUTS, KPIS)
+    with patch("app.cache.time.monotonic", return_value=111.0):
+        assert store.get_kpis(handle, INPUTS) is None
+    assert len(store) == 0
+
+def test_store_is_bounded_and_private():
+    store = ResultStore(max_entries=3)
+    for _ in range(10):
+        store.put(INPUTS, KPIS)
+    assert len(store) == 3
@@ -16,6 +16,7 @@ function App() {
 
   const [charts, setCharts] = useState<SimulationFrame[]>([]);
   const [kpis, setKpis] = useState<SimulationKPIs | null>(null);
+  const [resultId, setResultId] = useState<string | undefined>(undefined);
   const [proposal, setProposal] = useState<string>("");
   const [loadingAI, setLoadingAI] = useState(false);
 
@@ -27,6 +28,7 @@ function App() {
       const data = await fetchCalculation(inputs);
       setCharts(data.charts);
       setKpis(data.kpis);
+      setResultId(data.result_id);
     } catch (error) {
       console.error("Simulation failed:", error);
     }
@@ -45,7 +47,8 @@ function App() {
     setLoadingAI(true);
     setProposal("");
     try {
-      const text = await fetchProposal(inputs);
+      // Reuse the server-side simulation result instead of recomputing it
+      const text = await fetchProposal(inputs, resultId);
       setProposal(text);
     } catch (error) {
       console.error("AI generation failed:", error);
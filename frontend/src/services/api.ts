@@ -21,6 +21,7 @@ export interface SimulationKPIs {
 export interface CalculationResponse {
   kpis: SimulationKPIs;
   charts: SimulationFrame[];
+  result_id?: string;
 }
 
 export interface Inputs {
@@ -37,7 +38,7 @@ export const fetchCalculation = async (inputs: Inputs): Promise<CalculationRespo
   return response.data;
 };
 
-export const fetchProposal = async (inputs: Inputs): Promise<string> => {
-  const response = await axios.post(`${API_URL}/generate-proposal`, inputs);
+export const fetchProposal = async (inputs: Inputs, resultId?: string): Promise<string> => {
+  const response = await axios.post(`${API_URL}/generate-proposal`, { ...inputs, result_id: resultId });
   return response.data.proposal_text;
 };
\ No newline at end of file